@@ -0,0 +1,50 @@
+"""Add composite and covering indexes for analytics aggregations."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241015_add_metric_covering_indexes"
+down_revision = "20241014_add_content_to_execution_logs"
+branch_labels = None
+depends_on = None
+
+METRIC_INDEXES = {
+    "idx_metric_user_type_timestamp": "user_id",
+    "idx_metric_agent_type_timestamp": "agent_id",
+    "idx_metric_conversation_type_timestamp": "conversation_id",
+}
+
+
+def upgrade() -> None:
+    """Create (scope, metric_type, timestamp) indexes covering value/unit."""
+    for name, scope_column in METRIC_INDEXES.items():
+        op.create_index(
+            name,
+            "metric_events",
+            [scope_column, "metric_type", "timestamp"],
+            unique=False,
+            postgresql_include=["value", "unit"],
+        )
+
+    op.drop_index("idx_perf_operation_timestamp", table_name="performance_metrics")
+    op.create_index(
+        "idx_perf_operation_timestamp",
+        "performance_metrics",
+        ["operation", "timestamp"],
+        unique=False,
+        postgresql_include=["status", "duration_ms"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the covering indexes."""
+    op.drop_index("idx_perf_operation_timestamp", table_name="performance_metrics")
+    op.create_index(
+        "idx_perf_operation_timestamp",
+        "performance_metrics",
+        ["operation", "timestamp"],
+        unique=False,
+    )
+
+    for name in METRIC_INDEXES:
+        op.drop_index(name, table_name="metric_events")
@@ -0,0 +1,24 @@
+"""Add composite index for keyset pagination of messages."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241016_add_message_keyset_index"
+down_revision = "20241015_add_metric_covering_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (conversation_id, created_at, id) index on messages."""
+    op.create_index(
+        "idx_message_conversation_created",
+        "messages",
+        ["conversation_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset index."""
+    op.drop_index("idx_message_conversation_created", table_name="messages")
@@ -0,0 +1,24 @@
+"""Add covering index for execution log statistics."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241017_add_log_stats_index"
+down_revision = "20241016_add_message_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (conversation_id, level, event_type, timestamp) index."""
+    op.create_index(
+        "idx_conversation_level_event_timestamp",
+        "execution_logs",
+        ["conversation_id", "level", "event_type", "timestamp"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the log statistics index."""
+    op.drop_index("idx_conversation_level_event_timestamp", table_name="execution_logs")
@@ -0,0 +1,19 @@
+"""Add index on users.created_at for the default-user lookup."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241018_add_users_created_at_index"
+down_revision = "20241017_add_log_stats_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create index on users.created_at."""
+    op.create_index("ix_users_created_at", "users", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the users.created_at index."""
+    op.drop_index("ix_users_created_at", table_name="users")
@@ -0,0 +1,24 @@
+"""Add composite index for removing group chat participants."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241019_add_participant_chat_agent_index"
+down_revision = "20241018_add_users_created_at_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (group_chat_id, agent_id) index on group_chat_participants."""
+    op.create_index(
+        "idx_participant_chat_agent",
+        "group_chat_participants",
+        ["group_chat_id", "agent_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the participant lookup index."""
+    op.drop_index("idx_participant_chat_agent", table_name="group_chat_participants")
@@ -0,0 +1,24 @@
+"""Add composite index for newest-first paging of execution logs."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241020_add_log_keyset_index"
+down_revision = "20241019_add_participant_chat_agent_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (conversation_id, timestamp, id) index on execution_logs."""
+    op.create_index(
+        "idx_conversation_timestamp_id",
+        "execution_logs",
+        ["conversation_id", "timestamp", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the log paging index."""
+    op.drop_index("idx_conversation_timestamp_id", table_name="execution_logs")
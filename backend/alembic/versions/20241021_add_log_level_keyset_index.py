@@ -0,0 +1,24 @@
+"""Add composite index for paging execution logs filtered by level."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241021_add_log_level_keyset_index"
+down_revision = "20241020_add_log_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (conversation_id, level, timestamp, id) index on execution_logs."""
+    op.create_index(
+        "idx_conversation_level_timestamp_id",
+        "execution_logs",
+        ["conversation_id", "level", "timestamp", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the level-filtered log paging index."""
+    op.drop_index("idx_conversation_level_timestamp_id", table_name="execution_logs")
@@ -0,0 +1,26 @@
+"""Drop the execution log conversation_id index covered by composite indexes."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241022_drop_log_conversation_index"
+down_revision = "20241021_add_log_level_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop ix_execution_logs_conversation_id, a prefix of the paging index."""
+    op.drop_index(
+        op.f("ix_execution_logs_conversation_id"), table_name="execution_logs"
+    )
+
+
+def downgrade() -> None:
+    """Recreate the single-column conversation_id index."""
+    op.create_index(
+        op.f("ix_execution_logs_conversation_id"),
+        "execution_logs",
+        ["conversation_id"],
+        unique=False,
+    )
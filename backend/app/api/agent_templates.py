@@ -6,12 +6,13 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from backend.app import schemas
-from backend.app.database import get_db
+from backend.app.core.cache import template_cache
+from backend.app.database import CommitRoute, get_db
 from backend.app.middleware.rate_limit import limiter
 from backend.app.models.agent_template import AgentTemplate
 from backend.app.services import agent_template_service
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
 
 
 @router.post(
@@ -33,17 +34,28 @@ def list_templates(
     limit: int = 100,
     category: str | None = None,
     db: Session = Depends(get_db),
-) -> list[AgentTemplate]:
+) -> list[schemas.AgentTemplate]:
     """List all agent templates with pagination and optional filtering."""
-    return agent_template_service.list_templates(
-        db, skip=skip, limit=limit, category=category
+    return template_cache.get_or_set(
+        ("list", skip, limit, category),
+        lambda: [
+            schemas.AgentTemplate.model_validate(template)
+            for template in agent_template_service.list_templates(
+                db, skip=skip, limit=limit, category=category
+            )
+        ],
     )
 
 
 @router.get("/{template_id}", response_model=schemas.AgentTemplate)
-def get_template(template_id: UUID, db: Session = Depends(get_db)) -> AgentTemplate:
+def get_template(
+    template_id: UUID, db: Session = Depends(get_db)
+) -> schemas.AgentTemplate:
     """Get template by ID."""
-    template = agent_template_service.get_template(db, template_id)
+    template = template_cache.get_or_set(
+        ("get", template_id),
+        lambda: _load_template(db, template_id),
+    )
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Template not found"
@@ -51,6 +63,12 @@ def get_template(template_id: UUID, db: Session = Depends(get_db)) -> AgentTempl
     return template
 
 
+def _load_template(db: Session, template_id: UUID) -> schemas.AgentTemplate | None:
+    """Load a template and serialize it for caching."""
+    template = agent_template_service.get_template(db, template_id)
+    return schemas.AgentTemplate.model_validate(template) if template else None
+
+
 @router.put("/{template_id}", response_model=schemas.AgentTemplate)
 @limiter.limit("10/minute")
 def update_template(
@@ -6,11 +6,12 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
-from backend.app.database import get_db
+from backend.app.core.cache import agent_cache
+from backend.app.database import CommitRoute, get_db
 from backend.app.middleware.rate_limit import limiter
 from backend.app.services import agent_service
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
 
 
 @router.post("/", response_model=schemas.Agent, status_code=status.HTTP_201_CREATED)
@@ -25,15 +26,21 @@ def create_agent(
 @router.get("/", response_model=list[schemas.Agent])
 def list_agents(
     skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
-) -> list[models.Agent]:
+) -> list[schemas.Agent]:
     """List all agents with pagination."""
-    return agent_service.list_agents(db, skip=skip, limit=limit)
+    return agent_cache.get_or_set(
+        ("list", skip, limit),
+        lambda: [
+            schemas.Agent.model_validate(agent)
+            for agent in agent_service.list_agents(db, skip=skip, limit=limit)
+        ],
+    )
 
 
 @router.get("/{agent_id}", response_model=schemas.Agent)
-def get_agent(agent_id: UUID, db: Session = Depends(get_db)) -> models.Agent:
+def get_agent(agent_id: UUID, db: Session = Depends(get_db)) -> schemas.Agent:
     """Get agent by ID."""
-    agent = agent_service.get_agent(db, agent_id)
+    agent = agent_cache.get_or_set(("get", agent_id), lambda: _load_agent(db, agent_id))
     if not agent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Agent not found"
@@ -41,6 +48,12 @@ def get_agent(agent_id: UUID, db: Session = Depends(get_db)) -> models.Agent:
     return agent
 
 
+def _load_agent(db: Session, agent_id: UUID) -> schemas.Agent | None:
+    """Load an agent with its versions and serialize it for caching."""
+    agent = agent_service.get_agent_with_versions(db, agent_id)
+    return schemas.Agent.model_validate(agent) if agent else None
+
+
 @router.put("/{agent_id}", response_model=schemas.Agent)
 @limiter.limit("10/minute")
 def update_agent(
@@ -1,19 +1,30 @@
 """Analytics API endpoints."""
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.app import schemas
 from backend.app.core.dependencies import get_current_active_user
-from backend.app.database import get_db
+from backend.app.database import CommitRoute, get_db
 from backend.app.middleware.rate_limit import limiter
 from backend.app.models.user import User
 from backend.app.services.analytics_service import AnalyticsService
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
 
 
 def get_analytics_service(db: Session = Depends(get_db)) -> AnalyticsService:
@@ -46,6 +57,26 @@ def create_metric_event(
     return schemas.MetricEventResponse.model_validate(db_metric)
 
 
+@router.post("/metrics/bulk", status_code=status.HTTP_201_CREATED)
+@limiter.limit("100/minute")
+def create_metric_events_bulk(
+    request: Request,
+    metrics: list[schemas.MetricEventCreate] = Body(..., max_length=1000),
+    current_user: User = Depends(get_current_active_user),
+    analytics: AnalyticsService = Depends(get_analytics_service),
+) -> dict:
+    """
+    Create many metric events in one request.
+
+    Lets clients batch high-frequency metrics into a single INSERT.
+    """
+    for metric in metrics:
+        if not metric.user_id:
+            metric.user_id = current_user.id
+
+    return {"created": analytics.create_metric_events_bulk(metrics)}
+
+
 @router.post(
     "/performance",
     response_model=schemas.PerformanceMetricResponse,
@@ -80,9 +111,10 @@ def get_metrics(
     end_date: datetime | None = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    after_id: UUID | None = None,
     current_user: User = Depends(get_current_active_user),
     analytics: AnalyticsService = Depends(get_analytics_service),
-) -> list[schemas.MetricEventResponse]:
+) -> Response:
     """
     Query metric events with filters.
 
@@ -98,6 +130,7 @@ def get_metrics(
         end_date=end_date,
         limit=limit,
         offset=offset,
+        after_id=after_id,
     )
 
     # Non-superusers can only query their own metrics
@@ -105,7 +138,53 @@ def get_metrics(
         query.user_id = current_user.id
 
     metrics = analytics.get_metric_events(query)
-    return [schemas.MetricEventResponse.model_validate(m) for m in metrics]
+    adapter = schemas.MetricEventListAdapter
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(metrics), by_alias=True),
+        media_type="application/json",
+    )
+
+
+@router.get("/metrics/stream")
+@limiter.limit("10/minute")
+def stream_metrics(
+    request: Request,
+    user_id: UUID | None = None,
+    agent_id: UUID | None = None,
+    conversation_id: UUID | None = None,
+    metric_type: str | None = None,
+    metric_name: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    current_user: User = Depends(get_current_active_user),
+    analytics: AnalyticsService = Depends(get_analytics_service),
+) -> StreamingResponse:
+    """
+    Stream every matching metric event as newline-delimited JSON.
+
+    Unlike ``GET /metrics`` this is not paginated; rows are fetched from the
+    database in batches and written out one line per event.
+    """
+    query = schemas.MetricsQuery(
+        user_id=user_id,
+        agent_id=agent_id,
+        conversation_id=conversation_id,
+        metric_type=metric_type,
+        metric_name=metric_name,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    # Non-superusers can only query their own metrics
+    if not current_user.is_superuser:
+        query.user_id = current_user.id
+
+    def generate() -> Iterator[bytes]:
+        for metric in analytics.get_metric_events_stream(query):
+            event = schemas.MetricEventResponse.model_validate(metric)
+            yield event.model_dump_json(by_alias=True).encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/metrics/summary", response_model=schemas.MetricsSummary)
@@ -9,11 +9,11 @@ from sqlalchemy.orm import Session
 from backend.app import models, schemas
 from backend.app.core.dependencies import get_current_active_user, get_current_superuser
 from backend.app.core.security import create_user_token
-from backend.app.database import get_db
+from backend.app.database import CommitRoute, get_db
 from backend.app.middleware.rate_limit import limiter
 from backend.app.services import user_service
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
 
 
 @router.post(
@@ -114,11 +114,12 @@ def update_current_user_info(
 def list_users(
     skip: int = 0,
     limit: int = 100,
+    after_id: UUID | None = None,
     current_user: models.User = Depends(get_current_superuser),
     db: Session = Depends(get_db),
 ) -> list[models.User]:
-    """List all users (superuser only)."""
-    return user_service.list_users(db, skip=skip, limit=limit)
+    """List all users (superuser only; pass after_id for keyset paging)."""
+    return user_service.list_users(db, skip=skip, limit=limit, after_id=after_id)
 
 
 @router.get("/users/{user_id}", response_model=schemas.User)
@@ -2,15 +2,23 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
-from backend.app.database import get_db
+from backend.app.database import CommitRoute, get_db
 from backend.app.middleware.rate_limit import limiter
 from backend.app.services import chat_service
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
 
 
 @router.post(
@@ -25,7 +33,7 @@ def create_conversation(
     return chat_service.create_conversation(db, conversation_data)
 
 
-@router.get("/sessions", response_model=list[schemas.Conversation])
+@router.get("/sessions", response_model=list[schemas.ConversationSummary])
 def list_conversations(
     skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ) -> list[models.Conversation]:
@@ -71,7 +79,19 @@ def create_message(
     "/sessions/{conversation_id}/messages", response_model=list[schemas.Message]
 )
 def list_messages(
-    conversation_id: UUID, db: Session = Depends(get_db)
-) -> list[models.Message]:
-    """List all messages in a conversation."""
-    return chat_service.list_messages(db, conversation_id)
+    conversation_id: UUID,
+    after_id: UUID | None = None,
+    limit: int = Query(
+        chat_service.MESSAGE_PAGE_LIMIT, ge=1, le=chat_service.MESSAGE_PAGE_LIMIT
+    ),
+    db: Session = Depends(get_db),
+) -> Response:
+    """List messages in a conversation, paging after the given message ID."""
+    messages = chat_service.list_messages(
+        db, conversation_id, after_id=after_id, limit=limit
+    )
+    adapter = schemas.MessageListAdapter
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(messages)),
+        media_type="application/json",
+    )
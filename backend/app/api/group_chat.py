@@ -7,11 +7,11 @@ from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
 from backend.app.autogen_integration.group_chat_manager import run_group_chat
-from backend.app.database import get_db
+from backend.app.database import CommitRoute, get_db
 from backend.app.middleware.rate_limit import limiter
 from backend.app.services import chat_service, group_chat_service
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
 
 
 @router.post(
@@ -31,10 +31,15 @@ def create_group_chat(
 
 @router.get("", response_model=list[schemas.GroupChat])
 def list_group_chats(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    after_id: UUID | None = None,
+    db: Session = Depends(get_db),
 ) -> list[models.GroupChat]:
-    """List all group chats with pagination."""
-    return group_chat_service.list_group_chats(db, skip=skip, limit=limit)
+    """List all group chats with pagination (pass after_id for keyset paging)."""
+    return group_chat_service.list_group_chats(
+        db, skip=skip, limit=limit, after_id=after_id
+    )
 
 
 @router.get("/{group_chat_id}", response_model=schemas.GroupChat)
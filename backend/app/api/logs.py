@@ -3,14 +3,20 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
-from backend.app.database import get_db
-from backend.app.services import log_service
+from backend.app.database import CommitRoute, get_db
+from backend.app.services import chat_service, log_service
 
-router = APIRouter()
+router = APIRouter(route_class=CommitRoute)
+
+EXPORT_MEDIA_TYPES = {
+    schemas.LogExportFormat.JSON: "application/json",
+    schemas.LogExportFormat.TXT: "text/plain",
+    schemas.LogExportFormat.CSV: "text/csv",
+}
 
 
 @router.post(
@@ -21,20 +27,34 @@ router = APIRouter()
 def create_log(
     log_data: schemas.ExecutionLogCreate, db: Session = Depends(get_db)
 ) -> models.ExecutionLog:
-    """Create a new execution log entry."""
-    return log_service.create_log(db, log_data)
+    """
+    Create a new execution log entry.
+
+    The row is written by a background batch flusher, so it becomes visible
+    to readers within ``LOG_FLUSH_INTERVAL_SECONDS``.
+    """
+    if not chat_service.get_conversation(db, log_data.conversation_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
+        )
+    return log_service.enqueue_log(log_data)
 
 
 @router.get("/sessions/{conversation_id}", response_model=list[schemas.ExecutionLog])
 def get_session_logs(
     conversation_id: UUID,
-    level: schemas.LogLevel | None = Query(None, description="Filter by log level"),
-    event_type: schemas.EventType | None = Query(
+    level: schemas.LogLevelValue | None = Query(
+        None, description="Filter by log level"
+    ),
+    event_type: schemas.EventTypeValue | None = Query(
         None, description="Filter by event type"
     ),
     agent_name: str | None = Query(None, description="Filter by agent name"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs"),
     offset: int = Query(0, ge=0, description="Number of logs to skip"),
+    after_id: UUID | None = Query(
+        None, description="ID of the last log of the previous page (keyset)"
+    ),
     db: Session = Depends(get_db),
 ) -> list[models.ExecutionLog]:
     """Get execution logs for a conversation with optional filtering."""
@@ -44,6 +64,7 @@ def get_session_logs(
         agent_name=agent_name,
         limit=limit,
         offset=offset,
+        after_id=after_id,
     )
     return log_service.get_logs(db, conversation_id, filter_params)
 
@@ -58,22 +79,24 @@ def get_session_stats(
 
 @router.get(
     "/sessions/{conversation_id}/export",
-    response_class=PlainTextResponse,
+    response_class=StreamingResponse,
 )
 def export_session_logs(
     conversation_id: UUID,
     format: schemas.LogExportFormat = Query(
         schemas.LogExportFormat.JSON, description="Export format (json, txt, csv)"
     ),
-    level: schemas.LogLevel | None = Query(None, description="Filter by log level"),
-    event_type: schemas.EventType | None = Query(
+    level: schemas.LogLevelValue | None = Query(
+        None, description="Filter by log level"
+    ),
+    event_type: schemas.EventTypeValue | None = Query(
         None, description="Filter by event type"
     ),
     agent_name: str | None = Query(None, description="Filter by agent name"),
     limit: int = Query(1000, ge=1, le=10000, description="Maximum number of logs"),
     offset: int = Query(0, ge=0, description="Number of logs to skip"),
     db: Session = Depends(get_db),
-) -> str:
+) -> StreamingResponse:
     """Export logs for a conversation in the specified format."""
     filter_params = schemas.LogFilter(
         level=level,
@@ -82,7 +105,10 @@ def export_session_logs(
         limit=limit,
         offset=offset,
     )
-    return log_service.export_logs(db, conversation_id, format, filter_params)
+    return StreamingResponse(
+        log_service.export_logs(db, conversation_id, format, filter_params),
+        media_type=EXPORT_MEDIA_TYPES[format],
+    )
 
 
 @router.delete(
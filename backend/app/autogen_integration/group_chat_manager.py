@@ -74,21 +74,13 @@ class GroupChatManager:
         )
 
         for participant in participants:
-            agent_model = (
-                self.db.query(models.Agent)
-                .filter(models.Agent.id == participant.agent_id)
-                .first()
-            )
+            agent_model = self.db.get(models.Agent, participant.agent_id)
 
             if not agent_model:
                 continue
 
             if participant.agent_version_id:
-                version = (
-                    self.db.query(models.AgentVersion)
-                    .filter(models.AgentVersion.id == participant.agent_version_id)
-                    .first()
-                )
+                version = self.db.get(models.AgentVersion, participant.agent_version_id)
                 config = version.config if version else {}
             elif agent_model.current_version:
                 config = agent_model.current_version.config
@@ -193,9 +185,7 @@ async def run_group_chat(
     Returns:
         Task result from conversation
     """
-    group_chat = (
-        db.query(models.GroupChat).filter(models.GroupChat.id == group_chat_id).first()
-    )
+    group_chat = db.get(models.GroupChat, group_chat_id)
 
     if not group_chat:
         msg = f"Group chat {group_chat_id} not found"
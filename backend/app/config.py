@@ -18,6 +18,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./agents_studio.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 20  # pool_size + overflow = AnyIO threadpool size
+    db_pool_timeout: int = 5
+    db_pool_recycle: int = 1800
+    db_query_cache_size: int = 1200
+    db_insertmanyvalues_page_size: int = 1000
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -30,10 +36,14 @@ class Settings(BaseSettings):
     rate_limit_default: str = "100/minute"
     rate_limit_strict: str = "10/minute"
 
+    # Caching
+    read_cache_ttl_seconds: float = 30.0
+
     # Authentication & Security
     secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12  # log2 work factor; tests lower it to the minimum
 
 
 settings = Settings()
@@ -0,0 +1,99 @@
+"""Process-local read-through caches for near-static API reads."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.config import settings
+
+T = TypeVar("T")
+
+# Session.info key holding the caches to clear once its transaction commits
+_CLEAR_ON_COMMIT_KEY = "clear_caches_on_commit"
+
+
+class TTLCache(Generic[T]):
+    """Small LRU cache whose entries expire after a fixed time-to-live.
+
+    Values are cached per process, so writers must call ``clear_on_commit``
+    (or ``clear``) to make their changes visible before the TTL runs out.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._lock = Lock()
+        # Bumped by clear() so loads that started before it are not stored
+        self._generation = 0
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Return the cached value for key, loading and storing it on a miss.
+
+        A ``None`` result is returned but not stored, so a row created after
+        a miss is found straight away.
+
+        Args:
+            key: Fully-bound query key (e.g. pagination and filter values)
+            loader: Callable producing the value when it is not cached
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+
+        value = loader()
+        if value is None:
+            return value
+        with self._lock:
+            # A clear() during the load means the value may predate a write
+            if generation == self._generation:
+                self._entries[key] = (now + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def clear_on_commit(self, db: Session) -> None:
+        """
+        Clear the cache once the session's current transaction commits.
+
+        Clearing at flush time would let a concurrent read cache the rows as
+        they were before the commit.
+
+        Args:
+            db: Session holding the uncommitted write
+        """
+        db.info.setdefault(_CLEAR_ON_COMMIT_KEY, set()).add(self)
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_caches_after_commit(session: Session) -> None:
+    """Clear the caches registered by writes in the committed transaction."""
+    if session.in_nested_transaction():
+        return
+    for cache in session.info.pop(_CLEAR_ON_COMMIT_KEY, ()):
+        cache.clear()
+
+
+# Serialized API responses, invalidated by the corresponding service writes
+template_cache: TTLCache = TTLCache(settings.read_cache_ttl_seconds)
+agent_cache: TTLCache = TTLCache(settings.read_cache_ttl_seconds)
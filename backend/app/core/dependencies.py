@@ -15,12 +15,16 @@ from backend.app.services import user_service
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
-async def get_current_user(
+def get_current_user(
     db: Session = Depends(get_db), token: str | None = Depends(oauth2_scheme)
 ) -> models.User:
     """
     Get current authenticated user from JWT token.
 
+    Declared sync so FastAPI runs it in the threadpool: it queries the
+    database and may bcrypt-hash the default guest password, neither of
+    which may block the event loop.
+
     Args:
         db: Database session
         token: JWT access token
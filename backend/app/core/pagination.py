@@ -0,0 +1,47 @@
+"""Keyset pagination helpers shared by the list services."""
+
+from typing import TypeVar
+from uuid import UUID
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a keyset cursor does not name an existing row."""
+
+
+def get_cursor(db: Session, model: type[T], cursor_id: UUID) -> T:
+    """
+    Load the row a keyset page continues after.
+
+    An unknown cursor is an error rather than a reason to restart at the
+    first page, which would hand a paging client the same rows forever.
+
+    Args:
+        db: Database session
+        model: Model class being paged
+        cursor_id: ID of the last row of the previous page
+
+    Returns:
+        Cursor row
+
+    Raises:
+        InvalidCursorError: If no row has the given ID
+    """
+    cursor = db.get(model, cursor_id)
+    if cursor is None:
+        raise InvalidCursorError(f"Unknown pagination cursor: {cursor_id}")
+    return cursor
+
+
+async def invalid_cursor_handler(
+    request: Request, exc: InvalidCursorError
+) -> JSONResponse:
+    """Report an unknown keyset cursor as a 400 Bad Request."""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)}
+    )
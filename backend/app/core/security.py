@@ -12,6 +12,7 @@ from backend.app.config import settings
 SECRET_KEY = getattr(settings, "secret_key", "your-secret-key-change-in-production")
 ALGORITHM = getattr(settings, "jwt_algorithm", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = getattr(settings, "access_token_expire_minutes", 30)
+BCRYPT_ROUNDS = getattr(settings, "bcrypt_rounds", 12)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -40,7 +41,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
@@ -1,18 +1,49 @@
 """Database configuration and session management."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Coroutine, Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from backend.app.config import settings
 
+_url = make_url(settings.database_url)
+_is_sqlite = _url.get_backend_name() == "sqlite"
+_is_memory = _is_sqlite and _url.database in (None, "", ":memory:")
+
+# Size the QueuePool for concurrent sync handlers (file SQLite included, whose
+# default of 5 + 10 connections starves the 40-thread request pool); in-memory
+# SQLite shares one connection across threads so they all see one database
+engine_args: dict[str, object] = (
+    {"poolclass": StaticPool}
+    if _is_memory
+    else {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+)
+
+# psycopg2 can also batch executemany UPDATE/DELETE via execute_batch; every
+# driver gets multi-row INSERT ... VALUES through insertmanyvalues
+if settings.database_url.startswith("postgresql+psycopg2"):
+    engine_args["executemany_mode"] = "values_plus_batch"
+
 # Create engine
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False}
-    if "sqlite" in settings.database_url
-    else {},
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    query_cache_size=settings.db_query_cache_size,
+    insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
+    **engine_args,
 )
 
 # Create session factory
@@ -25,15 +56,52 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
-    Get database session.
+    Get database session scoped to a single request.
+
+    Services only flush their changes. Routes built on ``CommitRoute`` commit
+    the session before the response is sent; whatever is still pending is
+    committed here when the request ends, or rolled back if the handler
+    raises.
+
+    Args:
+        request: Current request, which carries the session to ``CommitRoute``
 
     Yields:
         Database session that is automatically closed after use.
     """
     db = SessionLocal()
+    request.state.db = db
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+
+class CommitRoute(APIRoute):
+    """API route that commits the request's session before responding.
+
+    FastAPI runs the exit code of ``yield`` dependencies only after the
+    response has been sent, so a commit in ``get_db`` alone would let clients
+    act on writes that are not yet visible, and a failing commit would follow
+    a success status. Streaming responses still read through the session
+    while the body is sent, so they are left to ``get_db``.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the endpoint handler to commit once the response is built."""
+        handler = super().get_route_handler()
+
+        async def commit_then_respond(request: Request) -> Response:
+            response = await handler(request)
+            db = getattr(request.state, "db", None)
+            if db is not None and not isinstance(response, StreamingResponse):
+                await run_in_threadpool(db.commit)
+            return response
+
+        return commit_then_respond
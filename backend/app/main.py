@@ -11,9 +11,11 @@ from slowapi.errors import RateLimitExceeded
 from backend.app import models  # noqa: F401 ensures models are registered
 from backend.app.api import api_router, websockets
 from backend.app.config import settings
+from backend.app.core.pagination import InvalidCursorError, invalid_cursor_handler
 from backend.app.database import Base, engine
 from backend.app.middleware.analytics import AnalyticsMiddleware
 from backend.app.middleware.rate_limit import limiter
+from backend.app.services import log_service
 
 
 @asynccontextmanager
@@ -21,10 +23,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Application lifespan manager.
 
-    Creates database tables on startup.
+    Creates database tables on startup and drains buffered execution logs
+    on shutdown.
     """
     Base.metadata.create_all(bind=engine)
     yield
+    log_service.flush_logs()
 
 
 # Ensure tables exist for contexts that bypass lifespan (e.g., some tests)
@@ -41,6 +45,7 @@ app = FastAPI(
 # Add rate limiter state
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
+app.add_exception_handler(InvalidCursorError, invalid_cursor_handler)  # type: ignore[arg-type]
 
 # Configure CORS
 app.add_middleware(
@@ -68,6 +68,29 @@ class MetricEvent(Base):
         Index("idx_metric_type_timestamp", "metric_type", "timestamp"),
         Index("idx_metric_name_timestamp", "metric_name", "timestamp"),
         Index("idx_metric_conversation_timestamp", "conversation_id", "timestamp"),
+        # Equality columns first, then the timestamp range; INCLUDE lets
+        # Postgres answer SUM/COUNT over value with an index-only scan.
+        Index(
+            "idx_metric_user_type_timestamp",
+            "user_id",
+            "metric_type",
+            "timestamp",
+            postgresql_include=["value", "unit"],
+        ),
+        Index(
+            "idx_metric_agent_type_timestamp",
+            "agent_id",
+            "metric_type",
+            "timestamp",
+            postgresql_include=["value", "unit"],
+        ),
+        Index(
+            "idx_metric_conversation_type_timestamp",
+            "conversation_id",
+            "metric_type",
+            "timestamp",
+            postgresql_include=["value", "unit"],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -244,7 +267,12 @@ class PerformanceMetric(Base):
     )
 
     __table_args__ = (
-        Index("idx_perf_operation_timestamp", "operation", "timestamp"),
+        Index(
+            "idx_perf_operation_timestamp",
+            "operation",
+            "timestamp",
+            postgresql_include=["status", "duration_ms"],
+        ),
         Index("idx_perf_agent_operation", "agent_id", "operation"),
         Index("idx_perf_status_timestamp", "status", "timestamp"),
     )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.database import Base
@@ -77,6 +77,13 @@ class Message(Base):
         ForeignKey("messages.id", ondelete="SET NULL"), nullable=True
     )
 
+    # Keyset pagination walks (conversation_id, created_at, id)
+    __table_args__ = (
+        Index(
+            "idx_message_conversation_created", "conversation_id", "created_at", "id"
+        ),
+    )
+
     # Relationships
     conversation: Mapped["Conversation"] = relationship(
         "Conversation", back_populates="messages"
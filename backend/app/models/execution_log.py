@@ -26,10 +26,10 @@ class ExecutionLog(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, index=True
     )
+    # No single-column index: every composite index below leads with it
     conversation_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     event_type: Mapped[str] = mapped_column(
         String(50), nullable=False, index=True
@@ -57,9 +57,26 @@ class ExecutionLog(Base):
 
     # Composite indexes for common query patterns
     __table_args__ = (
-        Index("idx_conversation_timestamp", "conversation_id", "timestamp"),
-        Index("idx_conversation_level", "conversation_id", "level"),
+        # Matches get_logs' ORDER BY timestamp DESC, id DESC (scanned backwards),
+        # so pages are read straight off the index without a sort
+        Index("idx_conversation_timestamp_id", "conversation_id", "timestamp", "id"),
+        # Same order within one level, for get_logs' level filter
+        Index(
+            "idx_conversation_level_timestamp_id",
+            "conversation_id",
+            "level",
+            "timestamp",
+            "id",
+        ),
         Index("idx_conversation_event_type", "conversation_id", "event_type"),
+        # Covers get_log_stats, so its single GROUP BY is an index-only scan
+        Index(
+            "idx_conversation_level_event_timestamp",
+            "conversation_id",
+            "level",
+            "event_type",
+            "timestamp",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.database import Base
@@ -90,6 +90,9 @@ class GroupChatParticipant(Base):
         "GroupChat", back_populates="participants"
     )
 
+    # Serves remove_participant's DELETE by (group_chat_id, agent_id)
+    __table_args__ = (Index("idx_participant_chat_agent", "group_chat_id", "agent_id"),)
+
 
 class GroupChatConversation(Base):
     """Conversation within a group chat."""
@@ -32,6 +32,7 @@ class User(Base):
         nullable=False,
         server_default=func.now(),
         default=lambda: datetime.now(timezone.utc),
+        index=True,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -18,6 +18,7 @@ from backend.app.schemas.analytics import (
     AggregatedMetricResponse,
     CostBreakdown,
     MetricEventCreate,
+    MetricEventListAdapter,
     MetricEventResponse,
     MetricsQuery,
     MetricsSummary,
@@ -30,8 +31,10 @@ from backend.app.schemas.analytics import (
 from backend.app.schemas.chat import (
     Conversation,
     ConversationCreate,
+    ConversationSummary,
     Message,
     MessageCreate,
+    MessageListAdapter,
 )
 from backend.app.schemas.group_chat import (
     GroupChat,
@@ -44,11 +47,13 @@ from backend.app.schemas.group_chat import (
 )
 from backend.app.schemas.log import (
     EventType,
+    EventTypeValue,
     ExecutionLog,
     ExecutionLogCreate,
     LogExportFormat,
     LogFilter,
     LogLevel,
+    LogLevelValue,
     LogStats,
 )
 from backend.app.schemas.user import (
@@ -75,8 +80,10 @@ __all__ = [
     "AggregatedMetricResponse",
     "Conversation",
     "ConversationCreate",
+    "ConversationSummary",
     "CostBreakdown",
     "EventType",
+    "EventTypeValue",
     "ExecutionLog",
     "ExecutionLogCreate",
     "GroupChat",
@@ -90,10 +97,13 @@ __all__ = [
     "LogExportFormat",
     "LogFilter",
     "LogLevel",
+    "LogLevelValue",
     "LogStats",
     "Message",
     "MessageCreate",
+    "MessageListAdapter",
     "MetricEventCreate",
+    "MetricEventListAdapter",
     "MetricEventResponse",
     "MetricsQuery",
     "MetricsSummary",
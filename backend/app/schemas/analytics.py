@@ -1,16 +1,15 @@
 """Analytics API schemas."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class MetricEventCreate(BaseModel):
     """Schema for creating a metric event."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     user_id: UUID | None = None
     agent_id: UUID | None = None
     conversation_id: UUID | None = None
@@ -20,7 +19,7 @@ class MetricEventCreate(BaseModel):
     unit: str | None = Field(None, description="Unit of measurement (e.g., tokens, ms)")
     extra_metadata: dict | None = Field(
         None,
-        validation_alias=AliasChoices("metadata", "extra_metadata"),
+        validation_alias="metadata",
         serialization_alias="metadata",
         description="Additional context",
     )
@@ -39,10 +38,14 @@ class MetricEventResponse(BaseModel):
     metric_name: str
     value: float
     unit: str | None
-    extra_metadata: dict | None = Field(None, serialization_alias="metadata")
+    extra_metadata: Any = Field(None, serialization_alias="metadata")
     timestamp: datetime
 
 
+# Validates ORM rows and dumps a whole page straight to JSON bytes
+MetricEventListAdapter = TypeAdapter(list[MetricEventResponse])
+
+
 class AggregatedMetricResponse(BaseModel):
     """Schema for aggregated metric response."""
 
@@ -62,7 +65,7 @@ class AggregatedMetricResponse(BaseModel):
     min: float
     max: float
     unit: str | None
-    extra_metadata: dict | None = Field(None, serialization_alias="metadata")
+    extra_metadata: Any = Field(None, serialization_alias="metadata")
     created_at: datetime
     updated_at: datetime
 
@@ -80,7 +83,7 @@ class UsageQuotaResponse(BaseModel):
     reset_period: str
     last_reset: datetime
     next_reset: datetime
-    extra_metadata: dict | None = Field(None, serialization_alias="metadata")
+    extra_metadata: Any = Field(None, serialization_alias="metadata")
     created_at: datetime
     updated_at: datetime
 
@@ -88,8 +91,6 @@ class UsageQuotaResponse(BaseModel):
 class PerformanceMetricCreate(BaseModel):
     """Schema for creating a performance metric."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     agent_id: UUID | None = None
     conversation_id: UUID | None = None
     operation: str = Field(..., description="Operation or endpoint name")
@@ -98,7 +99,7 @@ class PerformanceMetricCreate(BaseModel):
     error_message: str | None = None
     extra_metadata: dict | None = Field(
         None,
-        validation_alias=AliasChoices("metadata", "extra_metadata"),
+        validation_alias="metadata",
         serialization_alias="metadata",
     )
 
@@ -115,7 +116,7 @@ class PerformanceMetricResponse(BaseModel):
     duration_ms: float
     status: str
     error_message: str | None
-    extra_metadata: dict | None = Field(None, serialization_alias="metadata")
+    extra_metadata: Any = Field(None, serialization_alias="metadata")
     timestamp: datetime
 
 
@@ -134,6 +135,9 @@ class MetricsQuery(BaseModel):
     )
     limit: int = Field(100, ge=1, le=1000)
     offset: int = Field(0, ge=0)
+    after_id: UUID | None = Field(
+        None, description="ID of the last event of the previous page (keyset)"
+    )
 
 
 class MetricsSummary(BaseModel):
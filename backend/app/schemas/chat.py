@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class MessageBase(BaseModel):
@@ -28,7 +28,12 @@ class Message(MessageBase):
     created_at: datetime
     parent_message_id: UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
 
 
 class ConversationBase(BaseModel):
@@ -45,8 +50,8 @@ class ConversationCreate(ConversationBase):
     agent_version_id: UUID | None = Field(None, description="Agent version ID")
 
 
-class Conversation(ConversationBase):
-    """Conversation response schema."""
+class ConversationSummary(ConversationBase):
+    """Conversation response schema without nested messages."""
 
     id: UUID
     agent_id: UUID
@@ -54,6 +59,20 @@ class Conversation(ConversationBase):
     started_at: datetime
     ended_at: datetime | None
     status: str
-    messages: list[Message] = []
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
+
+
+class Conversation(ConversationSummary):
+    """Conversation response schema."""
+
+    messages: list[Message] = Field(default_factory=list)
+
+
+# Validates ORM rows and dumps a whole page straight to JSON bytes
+MessageListAdapter = TypeAdapter(list[Message])
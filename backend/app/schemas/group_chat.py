@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GroupChatParticipantBase(BaseModel):
@@ -30,7 +30,12 @@ class GroupChatParticipant(GroupChatParticipantBase):
     group_chat_id: UUID
     added_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
 
 
 class GroupChatBase(BaseModel):
@@ -80,9 +85,14 @@ class GroupChat(GroupChatBase):
     status: str
     created_at: datetime
     updated_at: datetime
-    participants: list[GroupChatParticipant] = []
+    participants: list[GroupChatParticipant] = Field(default_factory=list)
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
 
 
 class GroupChatMessageCreate(BaseModel):
@@ -111,4 +121,4 @@ class GroupChatConversation(GroupChatConversationBase):
     conversation_id: UUID
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LogLevel(str, Enum):
@@ -26,11 +27,15 @@ class EventType(str, Enum):
     SYSTEM = "system"
 
 
+LogLevelValue = Literal["debug", "info", "warning", "error"]
+EventTypeValue = Literal["message", "function_call", "llm_call", "error", "system"]
+
+
 class ExecutionLogBase(BaseModel):
     """Base execution log schema."""
 
-    event_type: EventType = Field(..., description="Type of event")
-    level: LogLevel = Field(LogLevel.INFO, description="Log level")
+    event_type: EventTypeValue = Field(..., description="Type of event")
+    level: LogLevelValue = Field("info", description="Log level")
     agent_name: str | None = Field(None, description="Name of the agent")
     content: str = Field(..., description="Log message content")
     data: dict | None = Field(
@@ -51,19 +56,27 @@ class ExecutionLog(ExecutionLogBase):
     conversation_id: UUID
     timestamp: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
 
 
 class LogFilter(BaseModel):
     """Schema for filtering logs."""
 
-    level: LogLevel | None = Field(None, description="Filter by log level")
-    event_type: EventType | None = Field(None, description="Filter by event type")
+    level: LogLevelValue | None = Field(None, description="Filter by log level")
+    event_type: EventTypeValue | None = Field(None, description="Filter by event type")
     agent_name: str | None = Field(None, description="Filter by agent name")
     start_time: datetime | None = Field(None, description="Filter logs after this time")
     end_time: datetime | None = Field(None, description="Filter logs before this time")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of logs")
     offset: int = Field(0, ge=0, description="Number of logs to skip")
+    after_id: UUID | None = Field(
+        None, description="ID of the last log of the previous page (keyset)"
+    )
 
 
 class LogExportFormat(str, Enum):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -42,7 +42,12 @@ class User(UserBase):
     updated_at: datetime
     last_login: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
 
 
 class UserInDB(User):
@@ -0,0 +1,57 @@
+"""Roll up the previous hour of metric events for usage statistics.
+
+Intended to run hourly (e.g. from cron) so ``get_usage_statistics`` can read
+pre-aggregated rows instead of rescanning the raw event log.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from backend.app.database import SessionLocal
+from backend.app.models import AggregatedMetric
+from backend.app.services.analytics_service import ROLLUP_PERIOD, AnalyticsService
+
+
+def rollup_previous_hour(now: datetime | None = None) -> int:
+    """Aggregate the last full hour of metric events.
+
+    Args:
+        now: Reference time; defaults to the current UTC time
+
+    Returns:
+        Number of rollup rows written (0 if the hour was already rolled up)
+    """
+    now = now or datetime.now(timezone.utc)
+    period_end = now.replace(minute=0, second=0, microsecond=0)
+    period_start = period_end - timedelta(hours=1)
+
+    with SessionLocal() as session:
+        already_done = session.scalar(
+            select(AggregatedMetric.id)
+            .where(
+                AggregatedMetric.aggregation_period == ROLLUP_PERIOD,
+                AggregatedMetric.period_start == period_start,
+            )
+            .limit(1)
+        )
+        if already_done is not None:
+            return 0
+
+        rows = AnalyticsService(session).aggregate_metrics(
+            ROLLUP_PERIOD, period_start, period_end
+        )
+        session.commit()
+        return len(rows)
+
+
+def main() -> None:
+    """CLI entrypoint for the rollup script."""
+    count = rollup_previous_hour()
+    print(f"Wrote {count} hourly rollup rows.")
+
+
+if __name__ == "__main__":
+    main()
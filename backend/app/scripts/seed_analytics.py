@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from typing import Any, Tuple
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
 
-from backend.app.core.security import get_password_hash
 from backend.app.database import SessionLocal
 from backend.app.models import (
     Agent,
@@ -23,6 +23,8 @@ from backend.app.models import (
 SEED_EMAIL = "analytics@example.com"
 SEED_USERNAME = "analytics-demo"
 SEED_PASSWORD = "AnalyticsDemo!123"
+# Precomputed bcrypt hash of SEED_PASSWORD so seeding skips the costly KDF.
+SEED_HASHED_PASSWORD = "$2b$12$z4i3/zfbHVWsWwnXKZm8Ae4a8c/bZMkN5ZOSaSH7g2bwSe/DX/crm"
 SEED_AGENT_NAME = "Analytics Demo Agent"
 SEED_CONVERSATION_TITLE = "Analytics Demo Conversation"
 SEED_OPERATION = "agent.run"
@@ -31,15 +33,16 @@ SEED_METADATA_TAG = {"seed": "analytics-demo"}
 
 def seed_demo_analytics() -> None:
     """Populate the database with demo analytics entities and metrics."""
+    now = datetime.now(timezone.utc)
     with SessionLocal() as session:
         user = _get_or_create_user(session)
         agent = _get_or_create_agent(session, user)
-        conversation = _get_or_create_conversation(session, agent)
+        conversation = _get_or_create_conversation(session, agent, now)
 
         created_any = False
-        created_any |= _seed_metric_events(session, user, agent, conversation)
-        created_any |= _seed_performance_metrics(session, agent, conversation)
-        created_any |= _seed_usage_quotas(session, user)
+        created_any |= _seed_metric_events(session, user, agent, conversation, now)
+        created_any |= _seed_performance_metrics(session, agent, conversation, now)
+        created_any |= _seed_usage_quotas(session, user, now)
 
         if created_any:
             session.commit()
@@ -52,11 +55,10 @@ def _get_or_create_user(session: Session) -> User:
     if user is not None:
         return user
 
-    hashed_password = get_password_hash(SEED_PASSWORD)
     user = User(
         email=SEED_EMAIL,
         username=SEED_USERNAME,
-        hashed_password=hashed_password,
+        hashed_password=SEED_HASHED_PASSWORD,
         full_name="Analytics Demo User",
         is_superuser=True,
     )
@@ -66,7 +68,12 @@ def _get_or_create_user(session: Session) -> User:
 
 
 def _get_or_create_agent(session: Session, owner: User) -> Agent:
-    agent = session.query(Agent).filter(Agent.name == SEED_AGENT_NAME).first()
+    agent = (
+        session.query(Agent)
+        .options(selectinload(Agent.versions))
+        .filter(Agent.name == SEED_AGENT_NAME)
+        .first()
+    )
     if agent is not None:
         if agent.current_version_id is None and agent.versions:
             latest_version = agent.versions[-1]
@@ -101,7 +108,9 @@ def _get_or_create_agent(session: Session, owner: User) -> Agent:
     return agent
 
 
-def _get_or_create_conversation(session: Session, agent: Agent) -> Conversation:
+def _get_or_create_conversation(
+    session: Session, agent: Agent, now: datetime
+) -> Conversation:
     conversation = (
         session.query(Conversation)
         .filter(Conversation.title == SEED_CONVERSATION_TITLE)
@@ -110,7 +119,6 @@ def _get_or_create_conversation(session: Session, agent: Agent) -> Conversation:
     if conversation is not None:
         return conversation
 
-    now = datetime.now(timezone.utc)
     conversation = Conversation(
         agent_id=agent.id,
         agent_version_id=agent.current_version_id,
@@ -118,7 +126,7 @@ def _get_or_create_conversation(session: Session, agent: Agent) -> Conversation:
         status="completed",
         started_at=now - timedelta(days=3),
         ended_at=now - timedelta(days=3) + timedelta(minutes=15),
-        extra_data={"seed": "analytics-demo"},
+        extra_data=SEED_METADATA_TAG,
     )
     session.add(conversation)
     session.flush()
@@ -126,7 +134,11 @@ def _get_or_create_conversation(session: Session, agent: Agent) -> Conversation:
 
 
 def _seed_metric_events(
-    session: Session, user: User, agent: Agent, conversation: Conversation
+    session: Session,
+    user: User,
+    agent: Agent,
+    conversation: Conversation,
+    now: datetime,
 ) -> bool:
     existing = (
         session.query(MetricEvent)
@@ -137,29 +149,24 @@ def _seed_metric_events(
     if existing is not None:
         return False
 
-    now = datetime.now(timezone.utc)
-    events: list[MetricEvent] = []
+    rows: list[dict[str, Any]] = []
     for days_back in range(7):
         timestamp = (now - timedelta(days=days_back)).replace(
             hour=15, minute=30, second=0, microsecond=0
         )
-        cost_value = round(4.25 + days_back * 0.35, 2)
-        token_value = float(4200 + days_back * 180)
-        api_calls_value = float(45 + days_back * 3)
-
-        events.extend(
+        rows.extend(
             _build_metric_triplet(
                 user_id=user.id,
                 agent_id=agent.id,
                 conversation_id=conversation.id,
                 timestamp=timestamp,
-                cost=cost_value,
-                tokens=token_value,
-                api_calls=api_calls_value,
+                cost=round(4.25 + days_back * 0.35, 2),
+                tokens=4200.0 + days_back * 180,
+                api_calls=45.0 + days_back * 3,
             )
         )
 
-    session.add_all(events)
+    session.execute(insert(MetricEvent), rows)
     return True
 
 
@@ -172,46 +179,43 @@ def _build_metric_triplet(
     cost: float,
     tokens: float,
     api_calls: float,
-) -> Tuple[MetricEvent, MetricEvent, MetricEvent]:
+) -> Tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    base = {
+        "user_id": user_id,
+        "agent_id": agent_id,
+        "conversation_id": conversation_id,
+        "extra_metadata": SEED_METADATA_TAG,
+    }
     return (
-        MetricEvent(
-            user_id=user_id,
-            agent_id=agent_id,
-            conversation_id=conversation_id,
-            metric_type="cost",
-            metric_name="demo.cost",
-            value=cost,
-            unit="USD",
-            extra_metadata=SEED_METADATA_TAG,
-            timestamp=timestamp,
-        ),
-        MetricEvent(
-            user_id=user_id,
-            agent_id=agent_id,
-            conversation_id=conversation_id,
-            metric_type="token_usage",
-            metric_name="demo.tokens",
-            value=tokens,
-            unit="tokens",
-            extra_metadata=SEED_METADATA_TAG,
-            timestamp=timestamp + timedelta(minutes=1),
-        ),
-        MetricEvent(
-            user_id=user_id,
-            agent_id=agent_id,
-            conversation_id=conversation_id,
-            metric_type="api_call",
-            metric_name="demo.calls",
-            value=api_calls,
-            unit="calls",
-            extra_metadata=SEED_METADATA_TAG,
-            timestamp=timestamp + timedelta(minutes=2),
-        ),
+        {
+            **base,
+            "metric_type": "cost",
+            "metric_name": "demo.cost",
+            "value": cost,
+            "unit": "USD",
+            "timestamp": timestamp,
+        },
+        {
+            **base,
+            "metric_type": "token_usage",
+            "metric_name": "demo.tokens",
+            "value": tokens,
+            "unit": "tokens",
+            "timestamp": timestamp + timedelta(minutes=1),
+        },
+        {
+            **base,
+            "metric_type": "api_call",
+            "metric_name": "demo.calls",
+            "value": api_calls,
+            "unit": "calls",
+            "timestamp": timestamp + timedelta(minutes=2),
+        },
     )
 
 
 def _seed_performance_metrics(
-    session: Session, agent: Agent, conversation: Conversation
+    session: Session, agent: Agent, conversation: Conversation, now: datetime
 ) -> bool:
     existing = (
         session.query(PerformanceMetric)
@@ -222,30 +226,25 @@ def _seed_performance_metrics(
     if existing is not None:
         return False
 
-    now = datetime.now(timezone.utc)
-    metrics: list[PerformanceMetric] = []
-    for index in range(20):
-        timestamp = now - timedelta(hours=index)
-        status = "error" if index % 5 == 0 else "success"
-        duration = 180 + index * 7
-        metric = PerformanceMetric(
-            agent_id=agent.id,
-            conversation_id=conversation.id,
-            operation=SEED_OPERATION,
-            duration_ms=float(duration),
-            status=status,
-            error_message="Upstream timeout" if status == "error" else None,
-            extra_metadata=SEED_METADATA_TAG,
-            timestamp=timestamp,
-        )
-        metrics.append(metric)
-
-    session.add_all(metrics)
+    rows = [
+        {
+            "agent_id": agent.id,
+            "conversation_id": conversation.id,
+            "operation": SEED_OPERATION,
+            "duration_ms": 180.0 + index * 7,
+            "status": "error" if index % 5 == 0 else "success",
+            "error_message": "Upstream timeout" if index % 5 == 0 else None,
+            "extra_metadata": SEED_METADATA_TAG,
+            "timestamp": now - timedelta(hours=index),
+        }
+        for index in range(20)
+    ]
+
+    session.execute(insert(PerformanceMetric), rows)
     return True
 
 
-def _seed_usage_quotas(session: Session, user: User) -> bool:
-    now = datetime.now(timezone.utc)
+def _seed_usage_quotas(session: Session, user: User, now: datetime) -> bool:
     created_any = False
     quota_configs = {
         "api_call": (12000.0, 480.0),
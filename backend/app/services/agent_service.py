@@ -3,9 +3,11 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session, selectinload
 
 from backend.app import models, schemas
+from backend.app.core.cache import agent_cache
 
 
 def create_agent(db: Session, agent_data: schemas.AgentCreate) -> models.Agent:
@@ -42,8 +44,8 @@ def create_agent(db: Session, agent_data: schemas.AgentCreate) -> models.Agent:
         db.flush()
         agent.current_version_id = version.id
 
-    db.commit()
-    db.refresh(agent)
+    db.flush()
+    agent_cache.clear_on_commit(db)
     return agent
 
 
@@ -59,7 +61,13 @@ def list_agents(db: Session, skip: int = 0, limit: int = 100) -> list[models.Age
     Returns:
         List of agents
     """
-    return db.query(models.Agent).offset(skip).limit(limit).all()
+    return (
+        db.query(models.Agent)
+        .options(selectinload(models.Agent.versions))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 def get_agent(db: Session, agent_id: UUID) -> models.Agent | None:
@@ -73,7 +81,21 @@ def get_agent(db: Session, agent_id: UUID) -> models.Agent | None:
     Returns:
         Agent model or None if not found
     """
-    return db.query(models.Agent).filter(models.Agent.id == agent_id).first()
+    return db.get(models.Agent, agent_id)
+
+
+def get_agent_with_versions(db: Session, agent_id: UUID) -> models.Agent | None:
+    """
+    Get agent by ID with its versions loaded in the same round-trip.
+
+    Args:
+        db: Database session
+        agent_id: Agent ID
+
+    Returns:
+        Agent model with versions or None if not found
+    """
+    return db.get(models.Agent, agent_id, options=[selectinload(models.Agent.versions)])
 
 
 def update_agent(
@@ -90,17 +112,18 @@ def update_agent(
     Returns:
         Updated agent or None if not found
     """
-    agent = get_agent(db, agent_id)
-    if not agent:
-        return None
-
     update_data = agent_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(agent, field, value)
-
-    agent.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(agent)
+    if not update_data:
+        return get_agent(db, agent_id)
+
+    agent = db.scalars(
+        update(models.Agent)
+        .where(models.Agent.id == agent_id)
+        .values(**update_data, updated_at=datetime.now(timezone.utc))
+        .returning(models.Agent)
+    ).one_or_none()
+    if agent is not None:
+        agent_cache.clear_on_commit(db)
     return agent
 
 
@@ -115,12 +138,19 @@ def delete_agent(db: Session, agent_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    agent = get_agent(db, agent_id)
-    if not agent:
+    deleted_id = db.scalar(
+        delete(models.Agent)
+        .where(models.Agent.id == agent_id)
+        .returning(models.Agent.id)
+    )
+    if deleted_id is None:
         return False
 
-    db.delete(agent)
-    db.commit()
+    # Backends without enforced ON DELETE CASCADE (SQLite) keep orphan versions
+    db.execute(
+        delete(models.AgentVersion).where(models.AgentVersion.agent_id == agent_id)
+    )
+    agent_cache.clear_on_commit(db)
     return True
 
 
@@ -143,8 +173,10 @@ def create_agent_version(
         return None
 
     # Mark all existing versions as not current
-    for version in agent.versions:
-        version.is_current = False
+    db.query(models.AgentVersion).filter(
+        models.AgentVersion.agent_id == agent_id,
+        models.AgentVersion.is_current.is_(True),
+    ).update({"is_current": False}, synchronize_session=False)
 
     # Create new version
     new_version = models.AgentVersion(
@@ -162,8 +194,8 @@ def create_agent_version(
     agent.current_version_id = new_version.id
     agent.updated_at = datetime.now(timezone.utc)
 
-    db.commit()
-    db.refresh(new_version)
+    db.flush()
+    agent_cache.clear_on_commit(db)
     return new_version
 
 
@@ -181,17 +213,22 @@ def test_agent(
     Returns:
         Test result with status and response
     """
-    agent = get_agent(db, agent_id)
-    if not agent:
+    row = (
+        db.query(models.Agent, models.AgentVersion)
+        .outerjoin(
+            models.AgentVersion,
+            models.AgentVersion.id == models.Agent.current_version_id,
+        )
+        .filter(models.Agent.id == agent_id)
+        .first()
+    )
+    if not row:
         return {"success": False, "error": "Agent not found"}
 
+    agent, current_version = row
     if not agent.current_version_id:
         return {"success": False, "error": "Agent has no active version"}
 
-    # Get current version config
-    current_version = next(
-        (v for v in agent.versions if v.id == agent.current_version_id), None
-    )
     if not current_version:
         return {"success": False, "error": "Current version not found"}
 
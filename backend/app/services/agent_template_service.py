@@ -3,11 +3,56 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from backend.app import schemas
+from backend.app.core.cache import template_cache
 from backend.app.models.agent_template import AgentTemplate
 
+# Templates inserted by seed_default_templates
+DEFAULT_TEMPLATES: tuple[dict, ...] = (
+    {
+        "name": "Customer Support Agent",
+        "description": "Helpful customer support agent",
+        "category": "support",
+        "config": {
+            "system_message": (
+                "You are a helpful customer support agent. "
+                "Provide clear, friendly assistance to customers."
+            ),
+            "temperature": 0.7,
+            "max_tokens": 1000,
+        },
+    },
+    {
+        "name": "Code Review Agent",
+        "description": "Agent that reviews code and suggests improvements",
+        "category": "development",
+        "config": {
+            "system_message": (
+                "You are a code review expert. "
+                "Analyze code and provide constructive feedback."
+            ),
+            "temperature": 0.3,
+            "max_tokens": 2000,
+        },
+    },
+    {
+        "name": "Data Analyst Agent",
+        "description": "Agent that analyzes data and provides insights",
+        "category": "analytics",
+        "config": {
+            "system_message": (
+                "You are a data analyst. Analyze data and provide clear insights."
+            ),
+            "temperature": 0.5,
+            "max_tokens": 1500,
+        },
+    },
+)
+DEFAULT_TEMPLATE_NAMES = tuple(template["name"] for template in DEFAULT_TEMPLATES)
+
 
 def create_template(
     db: Session, template_data: schemas.AgentTemplateCreate
@@ -30,8 +75,8 @@ def create_template(
         is_public=template_data.is_public,
     )
     db.add(template)
-    db.commit()
-    db.refresh(template)
+    db.flush()
+    template_cache.clear_on_commit(db)
     return template
 
 
@@ -67,7 +112,7 @@ def get_template(db: Session, template_id: UUID) -> AgentTemplate | None:
     Returns:
         Template model or None if not found
     """
-    return db.query(AgentTemplate).filter(AgentTemplate.id == template_id).first()
+    return db.get(AgentTemplate, template_id)
 
 
 def update_template(
@@ -93,8 +138,8 @@ def update_template(
         setattr(template, field, value)
 
     template.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(template)
+    db.flush()
+    template_cache.clear_on_commit(db)
     return template
 
 
@@ -114,7 +159,8 @@ def delete_template(db: Session, template_id: UUID) -> bool:
         return False
 
     db.delete(template)
-    db.commit()
+    db.flush()
+    template_cache.clear_on_commit(db)
     return True
 
 
@@ -125,55 +171,18 @@ def seed_default_templates(db: Session) -> None:
     Args:
         db: Database session
     """
-    default_templates = [
-        {
-            "name": "Customer Support Agent",
-            "description": "Helpful customer support agent",
-            "category": "support",
-            "config": {
-                "system_message": (
-                    "You are a helpful customer support agent. "
-                    "Provide clear, friendly assistance to customers."
-                ),
-                "temperature": 0.7,
-                "max_tokens": 1000,
-            },
-        },
-        {
-            "name": "Code Review Agent",
-            "description": "Agent that reviews code and suggests improvements",
-            "category": "development",
-            "config": {
-                "system_message": (
-                    "You are a code review expert. "
-                    "Analyze code and provide constructive feedback."
-                ),
-                "temperature": 0.3,
-                "max_tokens": 2000,
-            },
-        },
-        {
-            "name": "Data Analyst Agent",
-            "description": "Agent that analyzes data and provides insights",
-            "category": "analytics",
-            "config": {
-                "system_message": (
-                    "You are a data analyst. Analyze data and provide clear insights."
-                ),
-                "temperature": 0.5,
-                "max_tokens": 1500,
-            },
-        },
+    existing = set(
+        db.execute(
+            select(AgentTemplate.name).where(
+                AgentTemplate.name.in_(DEFAULT_TEMPLATE_NAMES)
+            )
+        ).scalars()
+    )
+    rows = [
+        template for template in DEFAULT_TEMPLATES if template["name"] not in existing
     ]
-
-    for template_data in default_templates:
-        existing = (
-            db.query(AgentTemplate)
-            .filter(AgentTemplate.name == template_data["name"])
-            .first()
-        )
-        if not existing:
-            template = AgentTemplate(**template_data, is_public=True)
-            db.add(template)
+    if rows:
+        db.execute(insert(AgentTemplate), rows)
+        template_cache.clear_on_commit(db)
 
     db.commit()
@@ -1,11 +1,25 @@
 """Analytics service for tracking and aggregating metrics."""
 
+import math
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    Case,
+    Select,
+    and_,
+    case,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
 
+from backend.app.core.pagination import get_cursor
 from backend.app.models.analytics import (
     AggregatedMetric,
     MetricEvent,
@@ -22,6 +36,26 @@ from backend.app.schemas.analytics import (
     UsageStatistics,
 )
 
+# Granularity of the rollup rows read back by get_usage_statistics
+ROLLUP_PERIOD = "hour"
+
+# Quantiles reported by get_performance_statistics
+DURATION_PERCENTILES = (0.5, 0.95, 0.99)
+
+# Quota reset period lengths; unknown periods fall back to a day
+RESET_PERIOD_DELTAS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+
+# Metric column filtered by get_cost_breakdown for each entity type
+COST_ENTITY_COLUMNS = {
+    "agent": MetricEvent.agent_id,
+    "conversation": MetricEvent.conversation_id,
+}
+
 
 class AnalyticsService:
     """Service for managing analytics and metrics."""
@@ -33,59 +67,64 @@ class AnalyticsService:
         """Create a new metric event."""
         db_metric = MetricEvent(**metric.model_dump(exclude_unset=True))
         self.db.add(db_metric)
-        self.db.commit()
-        self.db.refresh(db_metric)
+        self.db.flush()
         return db_metric
 
+    def create_metric_events_bulk(self, metrics: list[MetricEventCreate]) -> int:
+        """Insert many metric events with a single executemany INSERT."""
+        rows = [metric.model_dump(exclude_unset=True) for metric in metrics]
+        if rows:
+            self.db.execute(insert(MetricEvent), rows)
+        return len(rows)
+
     def create_performance_metric(
         self, metric: PerformanceMetricCreate
     ) -> PerformanceMetric:
         """Create a new performance metric."""
         db_metric = PerformanceMetric(**metric.model_dump(exclude_unset=True))
         self.db.add(db_metric)
-        self.db.commit()
-        self.db.refresh(db_metric)
+        self.db.flush()
         return db_metric
 
     def get_metric_events(self, query: MetricsQuery) -> list[MetricEvent]:
-        """Query metric events with filters."""
-        stmt = select(MetricEvent)
-
-        # Apply filters
-        if query.user_id:
-            stmt = stmt.where(MetricEvent.user_id == query.user_id)
-        if query.agent_id:
-            stmt = stmt.where(MetricEvent.agent_id == query.agent_id)
-        if query.conversation_id:
-            stmt = stmt.where(MetricEvent.conversation_id == query.conversation_id)
-        if query.metric_type:
-            stmt = stmt.where(MetricEvent.metric_type == query.metric_type)
-        if query.metric_name:
-            stmt = stmt.where(MetricEvent.metric_name == query.metric_name)
-        if query.start_date:
-            stmt = stmt.where(MetricEvent.timestamp >= query.start_date)
-        if query.end_date:
-            stmt = stmt.where(MetricEvent.timestamp <= query.end_date)
-
-        # Apply pagination
-        stmt = stmt.order_by(MetricEvent.timestamp.desc())
+        """Query metric events with filters.
+
+        Results are capped by ``query.limit`` (at most 1000 rows); use
+        ``get_metric_events_stream`` for unbounded exports. An unknown
+        ``query.after_id`` raises ``InvalidCursorError``.
+        """
+        stmt = self._metric_events_stmt(query)
+
+        # Apply pagination; a keyset cursor avoids scanning skipped rows
+        if query.after_id is not None:
+            cursor = get_cursor(self.db, MetricEvent, query.after_id)
+            stmt = stmt.where(
+                tuple_(MetricEvent.timestamp, MetricEvent.id)
+                < tuple_(cursor.timestamp, cursor.id)
+            )
         stmt = stmt.offset(query.offset).limit(query.limit)
 
         result = self.db.execute(stmt)
         return list(result.scalars().all())
 
-    def get_metrics_summary(self, query: MetricsQuery) -> MetricsSummary:
-        """Get aggregated summary of metrics."""
-        stmt = select(
-            func.count(MetricEvent.id).label("total_events"),
-            func.sum(MetricEvent.value).label("total_value"),
-            func.avg(MetricEvent.value).label("average_value"),
-            func.min(MetricEvent.value).label("min_value"),
-            func.max(MetricEvent.value).label("max_value"),
-            MetricEvent.unit,
-        )
+    def get_metric_events_stream(
+        self, query: MetricsQuery, batch_size: int = 1000
+    ) -> Iterator[MetricEvent]:
+        """Iterate over every matching metric event, fetching in batches.
+
+        Pagination fields on the query are ignored; memory stays bounded by
+        ``batch_size`` rather than the size of the time window.
+        """
+        stmt = self._metric_events_stmt(query).execution_options(yield_per=batch_size)
+        return self.db.scalars(stmt)
+
+    def _metric_events_stmt(self, query: MetricsQuery) -> Select:
+        """Build the filtered, newest-first metric event SELECT."""
+        stmt = self._filter_metric_events(select(MetricEvent), query)
+        return stmt.order_by(MetricEvent.timestamp.desc(), MetricEvent.id.desc())
 
-        # Apply filters
+    def _filter_metric_events(self, stmt: Select, query: MetricsQuery) -> Select:
+        """Apply the metric event filters from a MetricsQuery to a SELECT."""
         if query.user_id:
             stmt = stmt.where(MetricEvent.user_id == query.user_id)
         if query.agent_id:
@@ -100,29 +139,29 @@ class AnalyticsService:
             stmt = stmt.where(MetricEvent.timestamp >= query.start_date)
         if query.end_date:
             stmt = stmt.where(MetricEvent.timestamp <= query.end_date)
+        return stmt
 
-        stmt = stmt.group_by(MetricEvent.unit)
-
-        result = self.db.execute(stmt).first()
-
-        if not result:
-            return MetricsSummary(
-                total_events=0,
-                total_value=0.0,
-                average_value=0.0,
-                min_value=0.0,
-                max_value=0.0,
-                unit=None,
-                start_date=query.start_date or datetime.now(timezone.utc),
-                end_date=query.end_date or datetime.now(timezone.utc),
-            )
+    def get_metrics_summary(self, query: MetricsQuery) -> MetricsSummary:
+        """Get aggregated summary of metrics."""
+        stmt = self._filter_metric_events(
+            select(
+                func.count(MetricEvent.id).label("total_events"),
+                func.coalesce(func.sum(MetricEvent.value), 0.0).label("total_value"),
+                func.coalesce(func.avg(MetricEvent.value), 0.0).label("average_value"),
+                func.coalesce(func.min(MetricEvent.value), 0.0).label("min_value"),
+                func.coalesce(func.max(MetricEvent.value), 0.0).label("max_value"),
+                func.max(MetricEvent.unit).label("unit"),
+            ),
+            query,
+        )
+        result = self.db.execute(stmt).one()
 
         return MetricsSummary(
-            total_events=result.total_events or 0,
-            total_value=result.total_value or 0.0,
-            average_value=result.average_value or 0.0,
-            min_value=result.min_value or 0.0,
-            max_value=result.max_value or 0.0,
+            total_events=result.total_events,
+            total_value=result.total_value,
+            average_value=result.average_value,
+            min_value=result.min_value,
+            max_value=result.max_value,
             unit=result.unit,
             start_date=query.start_date or datetime.now(timezone.utc),
             end_date=query.end_date or datetime.now(timezone.utc),
@@ -166,98 +205,105 @@ class AnalyticsService:
             MetricEvent.unit,
         )
 
-        results = self.db.execute(stmt).all()
-
-        aggregated = []
-        for row in results:
-            agg_metric = AggregatedMetric(
-                user_id=row.user_id,
-                agent_id=row.agent_id,
-                metric_type=row.metric_type,
-                metric_name=row.metric_name,
-                aggregation_period=period,
-                period_start=start_date,
-                period_end=end_date,
-                count=row.count,
-                sum=row.sum,
-                avg=row.avg,
-                min=row.min,
-                max=row.max,
-                unit=row.unit,
-            )
-            self.db.add(agg_metric)
-            aggregated.append(agg_metric)
-
-        self.db.commit()
+        rows = [
+            {
+                **row._asdict(),
+                "aggregation_period": period,
+                "period_start": start_date,
+                "period_end": end_date,
+            }
+            for row in self.db.execute(stmt)
+        ]
+        if not rows:
+            return []
+
+        aggregated = list(
+            self.db.scalars(insert(AggregatedMetric).returning(AggregatedMetric), rows)
+        )
+        self.db.flush()
         return aggregated
 
     def get_usage_statistics(
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> UsageStatistics:
-        """Get comprehensive usage statistics for a user."""
-        # Get API call count
-        api_calls_stmt = select(func.count(MetricEvent.id)).where(
-            and_(
-                MetricEvent.user_id == user_id,
-                MetricEvent.metric_type == "api_call",
-                MetricEvent.timestamp >= start_date,
-                MetricEvent.timestamp < end_date,
-            )
+        """Get comprehensive usage statistics for a user.
+
+        Hours already rolled up into hourly ``AggregatedMetric`` rows are read
+        from the rollup; every other hour in the window (the current, partial
+        hour, or any hour the rollup job skipped) is aggregated from raw
+        ``MetricEvent`` rows.
+        """
+        rollup_filter = and_(
+            AggregatedMetric.user_id == user_id,
+            AggregatedMetric.aggregation_period == ROLLUP_PERIOD,
+            AggregatedMetric.period_start >= start_date,
+            AggregatedMetric.period_end <= end_date,
         )
-        total_api_calls = self.db.execute(api_calls_stmt).scalar() or 0
-
-        # Get total tokens
-        tokens_stmt = select(func.sum(MetricEvent.value)).where(
-            and_(
-                MetricEvent.user_id == user_id,
-                MetricEvent.metric_type == "token_usage",
-                MetricEvent.timestamp >= start_date,
-                MetricEvent.timestamp < end_date,
+        rollup_stmt = select(
+            func.sum(AggregatedMetric.count)
+            .filter(AggregatedMetric.metric_type == "api_call")
+            .label("api_calls"),
+            func.sum(AggregatedMetric.sum)
+            .filter(AggregatedMetric.metric_type == "token_usage")
+            .label("tokens"),
+            func.sum(AggregatedMetric.sum)
+            .filter(AggregatedMetric.metric_type == "cost")
+            .label("cost"),
+        ).where(rollup_filter)
+        rollup = self.db.execute(rollup_stmt).one()
+
+        # Skip only events inside an hour that has a rollup row, so gaps in the
+        # rollup coverage still fall through to the raw events
+        rolled_up = (
+            select(AggregatedMetric.id)
+            .where(
+                rollup_filter,
+                AggregatedMetric.period_start <= MetricEvent.timestamp,
+                AggregatedMetric.period_end > MetricEvent.timestamp,
             )
+            .exists()
         )
-        total_tokens = self.db.execute(tokens_stmt).scalar() or 0
 
-        # Get total cost
-        cost_stmt = select(func.sum(MetricEvent.value)).where(
+        usage_stmt = select(
+            func.count(MetricEvent.id)
+            .filter(MetricEvent.metric_type == "api_call")
+            .label("api_calls"),
+            func.sum(MetricEvent.value)
+            .filter(MetricEvent.metric_type == "token_usage")
+            .label("tokens"),
+            func.sum(MetricEvent.value)
+            .filter(MetricEvent.metric_type == "cost")
+            .label("cost"),
+        ).where(
             and_(
                 MetricEvent.user_id == user_id,
-                MetricEvent.metric_type == "cost",
                 MetricEvent.timestamp >= start_date,
                 MetricEvent.timestamp < end_date,
+                ~rolled_up,
             )
         )
-        total_cost = self.db.execute(cost_stmt).scalar() or 0.0
-
-        # Get average response time
-        latency_stmt = select(func.avg(PerformanceMetric.duration_ms)).where(
-            and_(
-                PerformanceMetric.timestamp >= start_date,
-                PerformanceMetric.timestamp < end_date,
-            )
-        )
-        avg_response_time = self.db.execute(latency_stmt).scalar() or 0.0
-
-        # Get error rate
-        error_stmt = select(
-            func.count(PerformanceMetric.id).filter(PerformanceMetric.status == "error")
+        usage = self.db.execute(usage_stmt).one()
+        total_api_calls = (usage.api_calls or 0) + (rollup.api_calls or 0)
+        total_tokens = (usage.tokens or 0) + (rollup.tokens or 0)
+        total_cost = (usage.cost or 0.0) + (rollup.cost or 0.0)
+
+        # Latency and error rate come from the same performance rows
+        performance_stmt = select(
+            func.count(PerformanceMetric.id).label("total_requests"),
+            func.count(PerformanceMetric.id)
+            .filter(PerformanceMetric.status == "error")
+            .label("error_count"),
+            func.avg(PerformanceMetric.duration_ms).label("avg_response_time"),
         ).where(
             and_(
                 PerformanceMetric.timestamp >= start_date,
                 PerformanceMetric.timestamp < end_date,
             )
         )
-        error_count = self.db.execute(error_stmt).scalar() or 0
-        total_requests = (
-            self.db.execute(
-                select(func.count(PerformanceMetric.id)).where(
-                    and_(
-                        PerformanceMetric.timestamp >= start_date,
-                        PerformanceMetric.timestamp < end_date,
-                    )
-                )
-            ).scalar()
-            or 0
-        )
+        performance = self.db.execute(performance_stmt).one()
+        total_requests = performance.total_requests or 0
+        error_count = performance.error_count or 0
+        avg_response_time = performance.avg_response_time or 0.0
         error_rate = error_count / total_requests if total_requests > 0 else 0.0
 
         # Get quotas
@@ -314,6 +360,10 @@ class AnalyticsService:
                 period_end=end_date,
             )
 
+        percentiles = self._duration_percentiles(
+            operation, start_date, end_date, result.total_calls
+        )
+
         return PerformanceStatistics(
             operation=operation,
             total_calls=result.total_calls,
@@ -322,10 +372,51 @@ class AnalyticsService:
             avg_duration_ms=result.avg_duration,
             min_duration_ms=result.min_duration,
             max_duration_ms=result.max_duration,
+            p50_duration_ms=percentiles.get(0.5),
+            p95_duration_ms=percentiles.get(0.95),
+            p99_duration_ms=percentiles.get(0.99),
             period_start=start_date,
             period_end=end_date,
         )
 
+    def _duration_percentiles(
+        self, operation: str, start_date: datetime, end_date: datetime, total: int
+    ) -> dict[float, float]:
+        """Fetch nearest-rank duration percentiles in a single query.
+
+        Only the rows at the requested ranks leave the database, so the cost
+        does not grow with the number of events transferred.
+        """
+        ranks = {
+            quantile: max(1, math.ceil(quantile * total))
+            for quantile in DURATION_PERCENTILES
+        }
+        ranked = (
+            select(
+                PerformanceMetric.duration_ms,
+                func.row_number()
+                .over(order_by=PerformanceMetric.duration_ms)
+                .label("rank"),
+            )
+            .where(
+                and_(
+                    PerformanceMetric.operation == operation,
+                    PerformanceMetric.timestamp >= start_date,
+                    PerformanceMetric.timestamp < end_date,
+                )
+            )
+            .subquery()
+        )
+        stmt = select(ranked.c.rank, ranked.c.duration_ms).where(
+            ranked.c.rank.in_(set(ranks.values()))
+        )
+        durations = dict(self.db.execute(stmt).tuples().all())
+        return {
+            quantile: durations[rank]
+            for quantile, rank in ranks.items()
+            if rank in durations
+        }
+
     def get_cost_breakdown(
         self,
         entity_type: str,
@@ -334,44 +425,30 @@ class AnalyticsService:
         end_date: datetime,
     ) -> CostBreakdown:
         """Get cost breakdown for an agent or conversation."""
-        filter_col = (
-            MetricEvent.agent_id
-            if entity_type == "agent"
-            else MetricEvent.conversation_id
-        )
-
-        # Get total cost
-        cost_stmt = select(func.sum(MetricEvent.value)).where(
-            and_(
+        filter_col = COST_ENTITY_COLUMNS.get(entity_type, MetricEvent.conversation_id)
+
+        # Compiled once per entity column; later calls only rebind parameters
+        stmt = lambda_stmt(
+            lambda: select(
+                func.sum(MetricEvent.value)
+                .filter(MetricEvent.metric_type == "cost")
+                .label("cost"),
+                func.sum(MetricEvent.value)
+                .filter(MetricEvent.metric_type == "token_usage")
+                .label("tokens"),
+                func.count(MetricEvent.id)
+                .filter(MetricEvent.metric_type == "api_call")
+                .label("api_calls"),
+            ).where(
                 filter_col == entity_id,
-                MetricEvent.metric_type == "cost",
                 MetricEvent.timestamp >= start_date,
                 MetricEvent.timestamp < end_date,
             )
         )
-        total_cost = self.db.execute(cost_stmt).scalar() or 0.0
-
-        # Get total tokens
-        tokens_stmt = select(func.sum(MetricEvent.value)).where(
-            and_(
-                filter_col == entity_id,
-                MetricEvent.metric_type == "token_usage",
-                MetricEvent.timestamp >= start_date,
-                MetricEvent.timestamp < end_date,
-            )
-        )
-        total_tokens = self.db.execute(tokens_stmt).scalar() or 0
-
-        # Get API calls
-        api_calls_stmt = select(func.count(MetricEvent.id)).where(
-            and_(
-                filter_col == entity_id,
-                MetricEvent.metric_type == "api_call",
-                MetricEvent.timestamp >= start_date,
-                MetricEvent.timestamp < end_date,
-            )
-        )
-        api_calls = self.db.execute(api_calls_stmt).scalar() or 0
+        totals = self.db.execute(stmt).one()
+        total_cost = totals.cost or 0.0
+        total_tokens = totals.tokens or 0
+        api_calls = totals.api_calls or 0
 
         return CostBreakdown(
             entity_id=entity_id,
@@ -386,39 +463,39 @@ class AnalyticsService:
     def update_usage_quota(
         self, user_id: UUID, quota_type: str, increment: float
     ) -> UsageQuota | None:
-        """Update a user's usage quota."""
-        stmt = select(UsageQuota).where(
-            and_(UsageQuota.user_id == user_id, UsageQuota.quota_type == quota_type)
-        )
-        quota = self.db.execute(stmt).scalar_one_or_none()
+        """Update a user's usage quota.
 
-        if not quota:
-            return None
-
-        # Check if quota needs reset
+        The reset check and the increment run as one conditional UPDATE, so
+        concurrent requests cannot overwrite each other's increments.
+        """
         now = datetime.now(timezone.utc)
-        if now >= quota.next_reset:
-            quota.used = 0.0
-            quota.last_reset = now
-            quota.next_reset = self._calculate_next_reset(now, quota.reset_period)
-
-        # Increment usage
-        quota.used += increment
-        self.db.commit()
-        self.db.refresh(quota)
-        return quota
-
-    def _calculate_next_reset(self, current_time: datetime, period: str) -> datetime:
-        """Calculate the next reset time based on the period."""
-        if period == "hour":
-            return current_time + timedelta(hours=1)
-        elif period == "day":
-            return current_time + timedelta(days=1)
-        elif period == "week":
-            return current_time + timedelta(weeks=1)
-        elif period == "month":
-            return current_time + timedelta(days=30)
-        return current_time + timedelta(days=1)
+        needs_reset = UsageQuota.next_reset <= now
+        stmt = (
+            update(UsageQuota)
+            .where(
+                and_(UsageQuota.user_id == user_id, UsageQuota.quota_type == quota_type)
+            )
+            .values(
+                used=case((needs_reset, increment), else_=UsageQuota.used + increment),
+                last_reset=case((needs_reset, now), else_=UsageQuota.last_reset),
+                next_reset=case(
+                    (needs_reset, self._next_reset_sql(now)),
+                    else_=UsageQuota.next_reset,
+                ),
+            )
+            .returning(UsageQuota)
+        )
+        return self.db.scalars(stmt).one_or_none()
+
+    def _next_reset_sql(self, current_time: datetime) -> Case:
+        """Build a SQL expression for the next reset time of each quota row."""
+        return case(
+            *(
+                (UsageQuota.reset_period == period, current_time + delta)
+                for period, delta in RESET_PERIOD_DELTAS.items()
+            ),
+            else_=current_time + RESET_PERIOD_DELTAS["day"],
+        )
 
     def check_quota_exceeded(
         self, user_id: UUID, quota_type: str
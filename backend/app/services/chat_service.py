@@ -2,9 +2,14 @@
 
 from uuid import UUID
 
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
+from backend.app.core.pagination import get_cursor
+
+# Default and hard cap on messages returned per page
+MESSAGE_PAGE_LIMIT = 200
 
 
 def create_conversation(
@@ -27,8 +32,7 @@ def create_conversation(
         extra_data=conversation_data.extra_data,
     )
     db.add(conversation)
-    db.commit()
-    db.refresh(conversation)
+    db.flush()
     return conversation
 
 
@@ -60,11 +64,7 @@ def get_conversation(db: Session, conversation_id: UUID) -> models.Conversation
     Returns:
         Conversation model or None if not found
     """
-    return (
-        db.query(models.Conversation)
-        .filter(models.Conversation.id == conversation_id)
-        .first()
-    )
+    return db.get(models.Conversation, conversation_id)
 
 
 def create_message(
@@ -93,25 +93,40 @@ def create_message(
         parent_message_id=message_data.parent_message_id,
     )
     db.add(message)
-    db.commit()
-    db.refresh(message)
+    db.flush()
     return message
 
 
-def list_messages(db: Session, conversation_id: UUID) -> list[models.Message]:
+def list_messages(
+    db: Session,
+    conversation_id: UUID,
+    after_id: UUID | None = None,
+    limit: int = MESSAGE_PAGE_LIMIT,
+) -> list[models.Message]:
     """
-    List all messages in a conversation.
+    List messages in a conversation using keyset pagination.
 
     Args:
         db: Database session
         conversation_id: Conversation ID
+        after_id: ID of the last message from the previous page
+        limit: Maximum number of messages to return
 
     Returns:
-        List of messages
+        List of messages ordered by creation time
+
+    Raises:
+        InvalidCursorError: If after_id names no message
     """
+    query = db.query(models.Message).filter(
+        models.Message.conversation_id == conversation_id
+    )
+    if after_id is not None:
+        cursor = get_cursor(db, models.Message, after_id)
+        query = query.filter(
+            tuple_(models.Message.created_at, models.Message.id)
+            > tuple_(cursor.created_at, cursor.id)
+        )
     return (
-        db.query(models.Message)
-        .filter(models.Message.conversation_id == conversation_id)
-        .order_by(models.Message.created_at)
-        .all()
+        query.order_by(models.Message.created_at, models.Message.id).limit(limit).all()
     )
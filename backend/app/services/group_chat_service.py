@@ -1,10 +1,13 @@
 """Group chat service with business logic."""
 
+from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
 
 from backend.app import models, schemas
+from backend.app.core.pagination import get_cursor
 
 
 def create_group_chat(
@@ -32,20 +35,18 @@ def create_group_chat(
     db.add(group_chat)
     db.flush()
 
-    for agent_id in group_chat_data.participant_agent_ids:
-        participant = models.GroupChatParticipant(
-            group_chat_id=group_chat.id,
-            agent_id=agent_id,
-        )
-        db.add(participant)
+    rows = [
+        {"group_chat_id": group_chat.id, "agent_id": agent_id}
+        for agent_id in group_chat_data.participant_agent_ids
+    ]
+    if rows:
+        db.execute(insert(models.GroupChatParticipant), rows)
 
-    db.commit()
-    db.refresh(group_chat)
     return group_chat
 
 
 def list_group_chats(
-    db: Session, skip: int = 0, limit: int = 100
+    db: Session, skip: int = 0, limit: int = 100, after_id: UUID | None = None
 ) -> list[models.GroupChat]:
     """
     List all group chats with pagination.
@@ -54,11 +55,29 @@ def list_group_chats(
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after_id: ID of the last group chat from the previous page (keyset)
 
     Returns:
-        List of group chats
+        List of group chats ordered by creation time
+
+    Raises:
+        InvalidCursorError: If after_id names no group chat
     """
-    return db.query(models.GroupChat).offset(skip).limit(limit).all()
+    query = db.query(models.GroupChat).options(
+        selectinload(models.GroupChat.participants)
+    )
+    if after_id is not None:
+        cursor = get_cursor(db, models.GroupChat, after_id)
+        query = query.filter(
+            tuple_(models.GroupChat.created_at, models.GroupChat.id)
+            > tuple_(cursor.created_at, cursor.id)
+        )
+    return (
+        query.order_by(models.GroupChat.created_at, models.GroupChat.id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 def get_group_chat(db: Session, group_chat_id: UUID) -> models.GroupChat | None:
@@ -72,8 +91,10 @@ def get_group_chat(db: Session, group_chat_id: UUID) -> models.GroupChat | None:
     Returns:
         Group chat model or None if not found
     """
-    return (
-        db.query(models.GroupChat).filter(models.GroupChat.id == group_chat_id).first()
+    return db.get(
+        models.GroupChat,
+        group_chat_id,
+        options=[selectinload(models.GroupChat.participants)],
     )
 
 
@@ -91,17 +112,16 @@ def update_group_chat(
     Returns:
         Updated group chat or None if not found
     """
-    group_chat = get_group_chat(db, group_chat_id)
-    if not group_chat:
-        return None
-
     update_dict = update_data.model_dump(exclude_unset=True)
-    for key, value in update_dict.items():
-        setattr(group_chat, key, value)
+    if not update_dict:
+        return get_group_chat(db, group_chat_id)
 
-    db.commit()
-    db.refresh(group_chat)
-    return group_chat
+    return db.scalars(
+        update(models.GroupChat)
+        .where(models.GroupChat.id == group_chat_id)
+        .values(**update_dict, updated_at=datetime.now(timezone.utc))
+        .returning(models.GroupChat)
+    ).one_or_none()
 
 
 def delete_group_chat(db: Session, group_chat_id: UUID) -> bool:
@@ -115,12 +135,17 @@ def delete_group_chat(db: Session, group_chat_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    group_chat = get_group_chat(db, group_chat_id)
-    if not group_chat:
+    deleted_id = db.scalar(
+        delete(models.GroupChat)
+        .where(models.GroupChat.id == group_chat_id)
+        .returning(models.GroupChat.id)
+    )
+    if deleted_id is None:
         return False
 
-    db.delete(group_chat)
-    db.commit()
+    # Backends without enforced ON DELETE CASCADE (SQLite) keep orphan rows
+    for child in (models.GroupChatParticipant, models.GroupChatConversation):
+        db.execute(delete(child).where(child.group_chat_id == group_chat_id))
     return True
 
 
@@ -152,8 +177,7 @@ def add_participant(
         constraints=participant_data.constraints,
     )
     db.add(participant)
-    db.commit()
-    db.refresh(participant)
+    db.flush()
     return participant
 
 
@@ -169,21 +193,13 @@ def remove_participant(db: Session, group_chat_id: UUID, agent_id: UUID) -> bool
     Returns:
         True if removed, False if not found
     """
-    participant = (
-        db.query(models.GroupChatParticipant)
-        .filter(
+    result = db.execute(
+        delete(models.GroupChatParticipant).where(
             models.GroupChatParticipant.group_chat_id == group_chat_id,
             models.GroupChatParticipant.agent_id == agent_id,
         )
-        .first()
     )
-
-    if not participant:
-        return False
-
-    db.delete(participant)
-    db.commit()
-    return True
+    return result.rowcount > 0
 
 
 def list_participants(
@@ -199,12 +215,14 @@ def list_participants(
     Returns:
         List of participants
     """
-    return (
-        db.query(models.GroupChatParticipant)
-        .filter(models.GroupChatParticipant.group_chat_id == group_chat_id)
-        .order_by(models.GroupChatParticipant.speaking_order)
-        .all()
+    stmt = lambda_stmt(
+        lambda: (
+            select(models.GroupChatParticipant)
+            .where(models.GroupChatParticipant.group_chat_id == group_chat_id)
+            .order_by(models.GroupChatParticipant.speaking_order)
+        )
     )
+    return list(db.scalars(stmt))
 
 
 def list_group_chat_messages(db: Session, group_chat_id: UUID) -> list[models.Message]:
@@ -218,19 +236,19 @@ def list_group_chat_messages(db: Session, group_chat_id: UUID) -> list[models.Me
     Returns:
         Messages ordered by creation time across all related conversations
     """
-    conversation_links = (
-        db.query(models.GroupChatConversation)
-        .filter(models.GroupChatConversation.group_chat_id == group_chat_id)
-        .all()
-    )
-
-    conversation_ids = [link.conversation_id for link in conversation_links]
-    if not conversation_ids:
-        return []
-
-    return (
-        db.query(models.Message)
-        .filter(models.Message.conversation_id.in_(conversation_ids))
-        .order_by(models.Message.created_at)
-        .all()
+    # Semi-join rather than JOIN so a conversation linked more than once
+    # does not duplicate its messages
+    stmt = lambda_stmt(
+        lambda: (
+            select(models.Message)
+            .where(
+                models.Message.conversation_id.in_(
+                    select(models.GroupChatConversation.conversation_id).where(
+                        models.GroupChatConversation.group_chat_id == group_chat_id
+                    )
+                )
+            )
+            .order_by(models.Message.created_at)
+        )
     )
+    return list(db.scalars(stmt))
@@ -1,11 +1,14 @@
 """User service with authentication business logic."""
 
 from datetime import datetime, timezone
+from functools import cache
 from uuid import UUID
 
+from sqlalchemy import delete, lambda_stmt, or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
+from backend.app.core.pagination import get_cursor
 from backend.app.core.security import get_password_hash, verify_password
 
 
@@ -20,7 +23,8 @@ def get_user_by_email(db: Session, email: str) -> models.User | None:
     Returns:
         User model or None if not found
     """
-    return db.query(models.User).filter(models.User.email == email).first()
+    stmt = lambda_stmt(lambda: select(models.User).where(models.User.email == email))
+    return db.scalars(stmt).first()
 
 
 def get_user_by_username(db: Session, username: str) -> models.User | None:
@@ -34,7 +38,10 @@ def get_user_by_username(db: Session, username: str) -> models.User | None:
     Returns:
         User model or None if not found
     """
-    return db.query(models.User).filter(models.User.username == username).first()
+    stmt = lambda_stmt(
+        lambda: select(models.User).where(models.User.username == username)
+    )
+    return db.scalars(stmt).first()
 
 
 def get_user_by_id(db: Session, user_id: UUID) -> models.User | None:
@@ -48,7 +55,7 @@ def get_user_by_id(db: Session, user_id: UUID) -> models.User | None:
     Returns:
         User model or None if not found
     """
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    return db.get(models.User, user_id)
 
 
 def create_user(db: Session, user_data: schemas.UserCreate) -> models.User:
@@ -70,8 +77,7 @@ def create_user(db: Session, user_data: schemas.UserCreate) -> models.User:
         full_name=user_data.full_name,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
 
@@ -87,10 +93,16 @@ def authenticate_user(db: Session, username: str, password: str) -> models.User
     Returns:
         User model if authentication succeeds, None otherwise
     """
-    # Try to find user by username or email
-    user = get_user_by_username(db, username)
-    if not user:
-        user = get_user_by_email(db, username)
+    # One lookup for username or email, preferring a username match
+    stmt = lambda_stmt(
+        lambda: (
+            select(models.User)
+            .where(or_(models.User.username == username, models.User.email == username))
+            .order_by((models.User.username == username).desc())
+            .limit(1)
+        )
+    )
+    user = db.scalars(stmt).first()
 
     if not user:
         return None
@@ -115,10 +127,6 @@ def update_user(
     Returns:
         Updated user or None if not found
     """
-    user = get_user_by_id(db, user_id)
-    if not user:
-        return None
-
     update_dict = user_data.model_dump(exclude_unset=True)
 
     # Handle password update separately
@@ -127,18 +135,24 @@ def update_user(
         if password:
             update_dict["hashed_password"] = get_password_hash(password)
 
-    for key, value in update_dict.items():
-        setattr(user, key, value)
+    if not update_dict:
+        return get_user_by_id(db, user_id)
 
-    db.commit()
-    db.refresh(user)
-    return user
+    return db.scalars(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(**update_dict, updated_at=datetime.now(timezone.utc))
+        .returning(models.User)
+    ).one_or_none()
 
 
 def update_last_login(db: Session, user_id: UUID) -> None:
     """
     Update user's last login timestamp.
 
+    The user is normally already in the session's identity map (e.g. from
+    ``authenticate_user``), in which case no SELECT is issued.
+
     Args:
         db: Database session
         user_id: User ID
@@ -146,10 +160,12 @@ def update_last_login(db: Session, user_id: UUID) -> None:
     user = get_user_by_id(db, user_id)
     if user:
         user.last_login = datetime.now(timezone.utc)
-        db.commit()
+        db.flush()
 
 
-def list_users(db: Session, skip: int = 0, limit: int = 100) -> list[models.User]:
+def list_users(
+    db: Session, skip: int = 0, limit: int = 100, after_id: UUID | None = None
+) -> list[models.User]:
     """
     List all users with pagination.
 
@@ -157,11 +173,27 @@ def list_users(db: Session, skip: int = 0, limit: int = 100) -> list[models.User
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after_id: ID of the last user from the previous page (keyset)
 
     Returns:
-        List of users
+        List of users ordered by creation time
+
+    Raises:
+        InvalidCursorError: If after_id names no user
     """
-    return db.query(models.User).offset(skip).limit(limit).all()
+    query = db.query(models.User)
+    if after_id is not None:
+        cursor = get_cursor(db, models.User, after_id)
+        query = query.filter(
+            tuple_(models.User.created_at, models.User.id)
+            > tuple_(cursor.created_at, cursor.id)
+        )
+    return (
+        query.order_by(models.User.created_at, models.User.id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 def delete_user(db: Session, user_id: UUID) -> bool:
@@ -175,56 +207,85 @@ def delete_user(db: Session, user_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    user = get_user_by_id(db, user_id)
-    if not user:
-        return False
-
-    db.delete(user)
-    db.commit()
-    return True
+    deleted_id = db.scalar(
+        delete(models.User).where(models.User.id == user_id).returning(models.User.id)
+    )
+    return deleted_id is not None
 
 
 def get_first_user(db: Session) -> models.User | None:
     """Retrieve the first available user.
 
+    The first user's ID is remembered once found, so later calls are a
+    primary-key lookup instead of an ``ORDER BY created_at`` query.
+
     Args:
         db: Database session
 
     Returns:
         First user or None when the table is empty
     """
+    global _first_user_id
+
+    if _first_user_id is not None:
+        user = db.get(models.User, _first_user_id)
+        if user is not None:
+            return user
 
-    return db.query(models.User).order_by(models.User.created_at).first()
+    user = db.query(models.User).order_by(models.User.created_at).first()
+    _first_user_id = user.id if user else None
+    return user
+
+
+@cache
+def _guest_password_hash() -> str:
+    """Hash the constant guest password once per process."""
+    return get_password_hash(DEFAULT_GUEST_PASSWORD)
 
 
 def ensure_default_user(db: Session) -> models.User:
     """Return an existing user or create a default guest user.
 
+    The guest's ID is remembered after the first call, so later calls are a
+    primary-key lookup that is usually served from the identity map.
+
     Args:
         db: Database session
 
     Returns:
         User record representing the default guest account
     """
+    global _guest_user_id
+
+    if _guest_user_id is not None:
+        user = db.get(models.User, _guest_user_id)
+        if user is not None:
+            return user
 
     user = get_user_by_username(db, DEFAULT_GUEST_USERNAME)
     if user:
+        _guest_user_id = user.id
         return user
 
-    guest = schemas.UserCreate(
+    guest = models.User(
         email=DEFAULT_GUEST_EMAIL,
         username=DEFAULT_GUEST_USERNAME,
-        password=DEFAULT_GUEST_PASSWORD,
+        hashed_password=_guest_password_hash(),
         full_name="Guest User",
+        is_superuser=True,
+        is_active=True,
     )
-    created = create_user(db, guest)
-    created.is_superuser = True
-    created.is_active = True
-    db.commit()
-    db.refresh(created)
-    return created
+    db.add(guest)
+    db.flush()
+    _guest_user_id = guest.id
+    return guest
 
 
 DEFAULT_GUEST_USERNAME = "guest"
 DEFAULT_GUEST_EMAIL = "guest@example.com"
 DEFAULT_GUEST_PASSWORD = "GuestPass!123"
+
+# IDs of the guest and first user rows once seen; stale IDs (e.g. a reset
+# database or a deleted user) fall back to the original queries
+_guest_user_id: UUID | None = None
+_first_user_id: UUID | None = None
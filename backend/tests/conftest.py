@@ -2,42 +2,259 @@
 
 # ruff: noqa: E402
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from functools import cache
+import os
+import sqlite3
 import sys
 from pathlib import Path
+from typing import Any
+from uuid import uuid4
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Request
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Connection, Engine, create_engine, event
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
 from sqlalchemy.pool import StaticPool
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from backend.app.database import Base
-from backend.app import models  # noqa: F401
+# Point the app's own engine (lifespan, middleware, TestClient requests without
+# a get_db override) at in-memory SQLite before backend.app reads settings
+os.environ["DATABASE_URL"] = "sqlite://"
+# bcrypt's minimum work factor: hashes stay valid, each one is ~256x cheaper
+os.environ["BCRYPT_ROUNDS"] = "4"
 
+from backend.app.core.cache import agent_cache, template_cache
+from backend.app.database import Base, get_db
+from backend.app.main import app
+from backend.app import models
 
-@pytest.fixture
-def db_engine():
-    """Create test database engine."""
+
+@pytest.fixture(autouse=True)
+def clear_read_caches() -> Generator[None, None, None]:
+    """Keep process-local API caches from leaking between test databases."""
+    yield
+    agent_cache.clear()
+    template_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits() -> None:
+    """Start each test with empty counters on the app-wide limiter."""
+    app.state.limiter.reset()
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """Provide one TestClient whose app lifespan runs once for the suite."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    """Provide one in-process async client for the suite.
+
+    Requests go straight to the ASGI app on the session event loop, without
+    TestClient's lifespan startup and per-request thread portal.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as test_client:
+        yield test_client
+
+
+@cache
+def _schema_template() -> sqlite3.Connection:
+    """Run the schema DDL once per process into a template database."""
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    Base.metadata.create_all(
+        bind=create_engine("sqlite://", creator=lambda: template, poolclass=StaticPool)
+    )
+    return template
+
+
+def _connect_from_template() -> sqlite3.Connection:
+    """Open an in-memory database holding a page copy of the template schema."""
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    _schema_template().backup(connection)
+    return connection
+
+
+def _create_test_engine(savepoints: bool = False) -> Engine:
+    """Create an in-memory SQLite engine with the full schema.
+
+    The schema is copied from a template with SQLite's backup API, which is
+    far cheaper than emitting the DDL from metadata for every engine.
+
+    Args:
+        savepoints: Let SQLAlchemy emit BEGIN itself, which nested
+            transactions (SAVEPOINT) need under pysqlite
+    """
     engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        "sqlite://", creator=_connect_from_template, poolclass=StaticPool
     )
-    Base.metadata.create_all(bind=engine)
+
+    if savepoints:
+
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, record) -> None:
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _emit_begin(connection) -> None:
+            connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(scope="session")
+def shared_engine() -> Generator[Engine, None, None]:
+    """Create the database once for every test that only uses db_session."""
+    engine = _create_test_engine(savepoints=True)
     yield engine
-    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
 @pytest.fixture
-def db_session(db_engine) -> Generator[Session, None, None]:
-    """Create test database session."""
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = SessionLocal()
+def db_engine() -> Generator[Engine, None, None]:
+    """Create a fresh test database for tests that commit on their own."""
+    engine = _create_test_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def module_connection(shared_engine: Engine) -> Generator[Connection, None, None]:
+    """Open a connection whose outer transaction spans one test module.
+
+    Module-scoped fixtures write read-only sample data through it once; it is
+    rolled back with everything else when the module finishes.
+    """
+    connection = shared_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def module_session(module_connection: Connection) -> Generator[Session, None, None]:
+    """Provide a session for module-scoped fixtures that seed shared data.
+
+    Its commits release a SAVEPOINT on the module connection, so seeded rows
+    stay visible to every test in the module and are rolled back with it.
+    Committed objects keep their loaded attributes for the tests to read.
+    """
+    session = Session(
+        bind=module_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
     try:
         yield session
     finally:
         session.close()
+
+
+@pytest.fixture
+def db_connection(module_connection: Connection) -> Generator[Connection, None, None]:
+    """Run the test in a SAVEPOINT on the module connection, rolled back after.
+
+    Sessions bound to it with ``join_transaction_mode="create_savepoint"``
+    turn their commits into SAVEPOINT releases, so nothing leaks between tests.
+    """
+    savepoint = module_connection.begin_nested()
+    try:
+        yield module_connection
+    finally:
+        if savepoint.is_active:
+            savepoint.rollback()
+
+
+@pytest.fixture
+def db_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """Create test database session rolled back after the test."""
+    session = Session(
+        bind=db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def db(db_session: Session) -> Generator[Session, None, None]:
+    """Serve the app's requests from db_session, so API calls see test data."""
+
+    def _override_get_db(request: Request) -> Generator[Session, None, None]:
+        request.state.db = db_session
+        yield db_session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        yield db_session
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def make_agent(db_session: Session) -> Callable[..., models.Agent]:
+    """Return a factory that inserts an agent straight through the ORM.
+
+    For tests that only need an agent to exist; passing ``config`` also gives
+    it a current 1.0.0 version, as ``initial_config`` does over the API.
+    """
+
+    def _make_agent(
+        config: dict[str, Any] | None = None, **fields: Any
+    ) -> models.Agent:
+        agent = models.Agent(
+            id=uuid4(),
+            **{"name": "Test Agent", "description": "Test", "type": "assistant"}
+            | fields,
+        )
+        db_session.add(agent)
+        if config is not None:
+            version = models.AgentVersion(
+                id=uuid4(),
+                agent_id=agent.id,
+                version="1.0.0",
+                config=config,
+                changelog="Initial version",
+                is_current=True,
+            )
+            agent.current_version_id = version.id
+            db_session.add(version)
+        db_session.flush()
+        return agent
+
+    return _make_agent
+
+
+@pytest.fixture
+def no_lazy_loads(db_session: Session) -> Generator[Session, None, None]:
+    """Make any relationship lazy load on db_session raise instead of query.
+
+    Loads that the query requests explicitly (e.g. ``selectinload``) still
+    work, so tests using this fixture fail on newly introduced N+1 queries.
+    """
+
+    def _raise_on_lazy_load(state: ORMExecuteState) -> None:
+        if state.is_select and not state.is_relationship_load:
+            state.statement = state.statement.options(raiseload("*"))
+
+    event.listen(db_session, "do_orm_execute", _raise_on_lazy_load)
+    db_session.expunge_all()
+    yield db_session
+    event.remove(db_session, "do_orm_execute", _raise_on_lazy_load)
@@ -1,6 +1,8 @@
 """Tests for agent service."""
 
-from backend.app import schemas
+from sqlalchemy import inspect
+
+from backend.app import models, schemas
 from backend.app.services import agent_service
 
 
@@ -35,6 +37,19 @@ def test_list_agents(db_session):
     assert len(agents) == 3
 
 
+def test_list_agents_eager_loads_versions(db_session, no_lazy_loads):
+    """Test that listing agents does not lazy load versions per agent."""
+    for i in range(2):
+        agent_data = schemas.AgentCreate(
+            name=f"Agent {i}", type="assistant", initial_config={"model": "gpt-4"}
+        )
+        agent_service.create_agent(db_session, agent_data)
+    db_session.expunge_all()
+
+    agents = agent_service.list_agents(db_session)
+    assert [len(agent.versions) for agent in agents] == [1, 1]
+
+
 def test_get_agent(db_session):
     """Test getting agent by ID."""
     agent_data = schemas.AgentCreate(
@@ -80,3 +95,88 @@ def test_delete_agent(db_session):
 
     agent = agent_service.get_agent(db_session, created_agent.id)
     assert agent is None
+
+
+def test_delete_agent_removes_versions(db_session):
+    """Deleting an agent removes its versions and reports missing agents."""
+    agent_data = schemas.AgentCreate(
+        name="Test Agent",
+        type="assistant",
+        initial_config={"model": "gpt-4"},
+    )
+    created_agent = agent_service.create_agent(db_session, agent_data)
+
+    assert agent_service.delete_agent(db_session, created_agent.id) is True
+    assert agent_service.delete_agent(db_session, created_agent.id) is False
+    versions = db_session.query(models.AgentVersion).filter_by(
+        agent_id=created_agent.id
+    )
+    assert versions.count() == 0
+    assert (
+        agent_service.update_agent(
+            db_session, created_agent.id, schemas.AgentUpdate(name="Gone")
+        )
+        is None
+    )
+
+
+def test_get_agent_with_versions(db_session):
+    """Test versions are loaded together with the agent."""
+    agent_data = schemas.AgentCreate(
+        name="Test Agent",
+        type="assistant",
+        initial_config={"model": "gpt-4"},
+    )
+    created_agent = agent_service.create_agent(db_session, agent_data)
+    db_session.expunge_all()
+
+    agent = agent_service.get_agent_with_versions(db_session, created_agent.id)
+
+    assert agent is not None
+    assert "versions" not in inspect(agent).unloaded
+    assert [version.version for version in agent.versions] == ["1.0.0"]
+
+
+def test_create_agent_version_replaces_current(db_session):
+    """Test a new version becomes the only current version."""
+    agent_data = schemas.AgentCreate(
+        name="Test Agent",
+        type="assistant",
+        initial_config={"model": "gpt-4"},
+    )
+    created_agent = agent_service.create_agent(db_session, agent_data)
+
+    version = agent_service.create_agent_version(
+        db_session,
+        created_agent.id,
+        schemas.AgentVersionCreate(version="2.0.0", config={"model": "gpt-4o"}),
+    )
+
+    assert version is not None
+    agent = agent_service.get_agent_with_versions(db_session, created_agent.id)
+    assert agent is not None
+    assert agent.current_version_id == version.id
+    current = [v.version for v in agent.versions if v.is_current]
+    assert current == ["2.0.0"]
+
+
+def test_test_agent_uses_current_version(db_session):
+    """Test agent testing reads the current version's configuration."""
+    agent_data = schemas.AgentCreate(
+        name="Test Agent",
+        type="assistant",
+        initial_config={"system_message": "Old"},
+    )
+    created_agent = agent_service.create_agent(db_session, agent_data)
+    agent_service.create_agent_version(
+        db_session,
+        created_agent.id,
+        schemas.AgentVersionCreate(
+            version="2.0.0", config={"system_message": "You are updated"}
+        ),
+    )
+
+    result = agent_service.test_agent(db_session, created_agent.id, "Hello")
+
+    assert result["success"] is True
+    assert result["system_message_length"] == len("You are updated")
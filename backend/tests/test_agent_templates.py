@@ -3,14 +3,11 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from backend.app.main import app
 from backend.app.schemas import AgentTemplateCreate
 from backend.app.services import agent_template_service
 
-client = TestClient(app)
 
-
-def test_create_template(db: Session) -> None:
+def test_create_template(client: TestClient, db: Session) -> None:
     """Test creating a new agent template."""
     template_data = {
         "name": "Test Template",
@@ -20,7 +17,7 @@ def test_create_template(db: Session) -> None:
         "is_public": True,
     }
 
-    response = client.post("/api/v1/agent-templates/", json=template_data)
+    response = client.post("/api/agent-templates/", json=template_data)
 
     assert response.status_code == 201
     data = response.json()
@@ -32,7 +29,7 @@ def test_create_template(db: Session) -> None:
     assert "created_at" in data
 
 
-def test_list_templates(db: Session) -> None:
+def test_list_templates(client: TestClient, db: Session) -> None:
     """Test listing agent templates."""
     # Create test templates
     for i in range(3):
@@ -47,7 +44,7 @@ def test_list_templates(db: Session) -> None:
             ),
         )
 
-    response = client.get("/api/v1/agent-templates/")
+    response = client.get("/api/agent-templates/")
 
     assert response.status_code == 200
     data = response.json()
@@ -55,7 +52,7 @@ def test_list_templates(db: Session) -> None:
     assert len(data) >= 3
 
 
-def test_get_template(db: Session) -> None:
+def test_get_template(client: TestClient, db: Session) -> None:
     """Test getting a specific template."""
     # Create a template
     template_data = AgentTemplateCreate(
@@ -67,7 +64,7 @@ def test_get_template(db: Session) -> None:
     )
     template = agent_template_service.create_template(db, template_data)
 
-    response = client.get(f"/api/v1/agent-templates/{template.id}")
+    response = client.get(f"/api/agent-templates/{template.id}")
 
     assert response.status_code == 200
     data = response.json()
@@ -75,17 +72,17 @@ def test_get_template(db: Session) -> None:
     assert data["name"] == template.name
 
 
-def test_get_template_not_found(db: Session) -> None:
+def test_get_template_not_found(client: TestClient, db: Session) -> None:
     """Test getting a non-existent template."""
     import uuid
 
     fake_id = uuid.uuid4()
-    response = client.get(f"/api/v1/agent-templates/{fake_id}")
+    response = client.get(f"/api/agent-templates/{fake_id}")
 
     assert response.status_code == 404
 
 
-def test_update_template(db: Session) -> None:
+def test_update_template(client: TestClient, db: Session) -> None:
     """Test updating a template."""
     # Create a template
     template_data = AgentTemplateCreate(
@@ -103,7 +100,7 @@ def test_update_template(db: Session) -> None:
         "description": "Updated description",
     }
 
-    response = client.put(f"/api/v1/agent-templates/{template.id}", json=update_data)
+    response = client.put(f"/api/agent-templates/{template.id}", json=update_data)
 
     assert response.status_code == 200
     data = response.json()
@@ -111,7 +108,7 @@ def test_update_template(db: Session) -> None:
     assert data["description"] == update_data["description"]
 
 
-def test_delete_template(db: Session) -> None:
+def test_delete_template(client: TestClient, db: Session) -> None:
     """Test deleting a template."""
     # Create a template
     template_data = AgentTemplateCreate(
@@ -123,16 +120,16 @@ def test_delete_template(db: Session) -> None:
     )
     template = agent_template_service.create_template(db, template_data)
 
-    response = client.delete(f"/api/v1/agent-templates/{template.id}")
+    response = client.delete(f"/api/agent-templates/{template.id}")
 
     assert response.status_code == 204
 
     # Verify it's gone
-    get_response = client.get(f"/api/v1/agent-templates/{template.id}")
+    get_response = client.get(f"/api/agent-templates/{template.id}")
     assert get_response.status_code == 404
 
 
-def test_list_templates_by_category(db: Session) -> None:
+def test_list_templates_by_category(client: TestClient, db: Session) -> None:
     """Test filtering templates by category."""
     # Create templates in different categories
     categories = ["support", "development", "analytics"]
@@ -148,10 +145,21 @@ def test_list_templates_by_category(db: Session) -> None:
             ),
         )
 
-    response = client.get("/api/v1/agent-templates/?category=support")
+    response = client.get("/api/agent-templates/?category=support")
 
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
     for template in data:
         assert template["category"] == "support"
+
+
+def test_seed_default_templates_is_idempotent(db_session: Session) -> None:
+    """Test seeding twice creates each default template once."""
+    agent_template_service.seed_default_templates(db_session)
+    agent_template_service.seed_default_templates(db_session)
+
+    templates = agent_template_service.list_templates(db_session)
+
+    assert len(templates) == 3
+    assert all(template.is_public for template in templates)
@@ -1,20 +1,25 @@
 """Tests for agent version endpoints."""
 
+from collections.abc import Callable
+from types import MappingProxyType
+
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from backend.app.main import app
+from backend.app import models
 
-client = TestClient(app)
+# Common agent fields; each test layers its own config on top
+_BASE_AGENT = MappingProxyType(
+    {"name": "Test Agent", "description": "Test", "type": "assistant"}
+)
 
 
-def test_create_agent_version(db: Session) -> None:
+def test_create_agent_version(client: TestClient, db: Session) -> None:
     """Test creating a new version for an agent."""
     # Create an agent first
     agent_data = {
-        "name": "Test Agent",
+        **_BASE_AGENT,
         "description": "Test description",
-        "type": "assistant",
         "status": "draft",
         "initial_config": {
             "system_message": "You are a helpful assistant",
@@ -22,7 +27,7 @@ def test_create_agent_version(db: Session) -> None:
         },
     }
 
-    agent_response = client.post("/api/v1/agents/", json=agent_data)
+    agent_response = client.post("/api/agents/", json=agent_data)
     assert agent_response.status_code == 201
     agent = agent_response.json()
     agent_id = agent["id"]
@@ -39,7 +44,7 @@ def test_create_agent_version(db: Session) -> None:
         "created_by": "test_user",
     }
 
-    response = client.post(f"/api/v1/agents/{agent_id}/versions", json=version_data)
+    response = client.post(f"/api/agents/{agent_id}/versions", json=version_data)
 
     assert response.status_code == 201
     data = response.json()
@@ -50,7 +55,7 @@ def test_create_agent_version(db: Session) -> None:
     assert data["is_current"] is True
 
 
-def test_create_version_for_nonexistent_agent(db: Session) -> None:
+def test_create_version_for_nonexistent_agent(client: TestClient, db: Session) -> None:
     """Test creating a version for a non-existent agent."""
     import uuid
 
@@ -61,23 +66,16 @@ def test_create_version_for_nonexistent_agent(db: Session) -> None:
         "changelog": "Test",
     }
 
-    response = client.post(f"/api/v1/agents/{fake_id}/versions", json=version_data)
+    response = client.post(f"/api/agents/{fake_id}/versions", json=version_data)
 
     assert response.status_code == 404
 
 
-def test_version_becomes_current(db: Session) -> None:
+def test_version_becomes_current(
+    client: TestClient, db: Session, make_agent: Callable[..., models.Agent]
+) -> None:
     """Test that new version becomes current and old one is not."""
-    # Create an agent
-    agent_data = {
-        "name": "Test Agent",
-        "description": "Test",
-        "type": "assistant",
-        "initial_config": {"system_message": "V1"},
-    }
-
-    agent_response = client.post("/api/v1/agents/", json=agent_data)
-    agent_id = agent_response.json()["id"]
+    agent_id = make_agent(config={"system_message": "V1"}).id
 
     # Create version 2
     version2_data = {
@@ -86,11 +84,11 @@ def test_version_becomes_current(db: Session) -> None:
         "changelog": "Version 2",
     }
 
-    v2_response = client.post(f"/api/v1/agents/{agent_id}/versions", json=version2_data)
+    v2_response = client.post(f"/api/agents/{agent_id}/versions", json=version2_data)
     assert v2_response.status_code == 201
 
     # Get agent and check versions
-    agent_response = client.get(f"/api/v1/agents/{agent_id}")
+    agent_response = client.get(f"/api/agents/{agent_id}")
     agent = agent_response.json()
 
     # Check that only the latest version is current
@@ -3,19 +3,24 @@
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+import pytest
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from backend.app.models.analytics import UsageQuota
+from backend.app.core.pagination import InvalidCursorError
+from backend.app.models.agent import Agent
+from backend.app.models.analytics import MetricEvent, UsageQuota
 from backend.app.models.user import User
 from backend.app.schemas.analytics import (
     MetricEventCreate,
     MetricEventResponse,
+    MetricsQuery,
     PerformanceMetricCreate,
     PerformanceMetricResponse,
     UsageQuotaResponse,
     UsageStatistics,
 )
-from backend.app.services.analytics_service import AnalyticsService
+from backend.app.services.analytics_service import ROLLUP_PERIOD, AnalyticsService
 
 
 def create_user(db_session: Session) -> User:
@@ -29,7 +34,7 @@ def create_user(db_session: Session) -> User:
         is_superuser=False,
     )
     db_session.add(user)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(user)
     return user
 
@@ -55,6 +60,33 @@ def test_create_metric_event_with_metadata(db_session: Session) -> None:
     assert response.extra_metadata == {"source": "test"}
 
 
+def test_create_metric_events_bulk(db_session: Session) -> None:
+    """Bulk ingestion stores every event, including optional fields."""
+
+    user = create_user(db_session)
+    service = AnalyticsService(db_session)
+    metrics = [
+        MetricEventCreate(
+            user_id=user.id, metric_type="api_call", metric_name="bulk", value=1.0
+        ),
+        MetricEventCreate(
+            user_id=user.id,
+            metric_type="token_usage",
+            metric_name="bulk",
+            value=42.0,
+            unit="tokens",
+            metadata={"batch": True},
+        ),
+    ]
+
+    assert service.create_metric_events_bulk(metrics) == 2
+
+    saved = service.get_metric_events(MetricsQuery(user_id=user.id))
+    by_type = {metric.metric_type: metric for metric in saved}
+    assert by_type["api_call"].value == 1.0
+    assert by_type["token_usage"].extra_metadata == {"batch": True}
+
+
 def test_create_performance_metric_with_metadata(db_session: Session) -> None:
     """Performance metrics must accept optional metadata payloads."""
 
@@ -82,18 +114,22 @@ def test_usage_statistics_returns_all_user_quotas(db_session: Session) -> None:
         ("api_calls", 100.0),
         ("tokens", 1000.0),
     ]
-    for quota_type, limit in quota_values:
-        quota = UsageQuota(
-            user_id=user.id,
-            quota_type=quota_type,
-            limit=limit,
-            used=0.0,
-            reset_period="day",
-            last_reset=now,
-            next_reset=now + timedelta(days=1),
-        )
-        db_session.add(quota)
-    db_session.commit()
+    db_session.execute(
+        insert(UsageQuota),
+        [
+            {
+                "user_id": user.id,
+                "quota_type": quota_type,
+                "limit": limit,
+                "used": 0.0,
+                "reset_period": "day",
+                "last_reset": now,
+                "next_reset": now + timedelta(days=1),
+            }
+            for quota_type, limit in quota_values
+        ],
+    )
+    db_session.flush()
 
     service = AnalyticsService(db_session)
     stats = service.get_usage_statistics(
@@ -107,6 +143,310 @@ def test_usage_statistics_returns_all_user_quotas(db_session: Session) -> None:
     assert quota_types == ["api_calls", "tokens"]
 
 
+def test_update_usage_quota_increments_and_resets(db_session: Session) -> None:
+    """Quota updates add to usage and restart it once the period expired."""
+
+    user = create_user(db_session)
+    now = datetime.now(timezone.utc)
+    db_session.execute(
+        insert(UsageQuota),
+        [
+            {
+                "user_id": user.id,
+                "quota_type": quota_type,
+                "limit": 100.0,
+                "used": 10.0,
+                "reset_period": "day",
+                "next_reset": next_reset,
+            }
+            for quota_type, next_reset in [
+                ("api_calls", now + timedelta(hours=1)),
+                ("tokens", now - timedelta(minutes=1)),
+            ]
+        ],
+    )
+    db_session.flush()
+
+    service = AnalyticsService(db_session)
+    active = service.update_usage_quota(user.id, "api_calls", 5.0)
+    expired = service.update_usage_quota(user.id, "tokens", 5.0)
+
+    assert active is not None and active.used == 15.0
+    assert expired is not None and expired.used == 5.0
+    assert expired.next_reset.replace(tzinfo=timezone.utc) > now + timedelta(hours=23)
+    assert service.update_usage_quota(user.id, "cost", 1.0) is None
+
+
+def test_usage_statistics_aggregates_metrics(db_session: Session) -> None:
+    """Usage statistics combine metric and performance totals per period."""
+
+    user = create_user(db_session)
+    now = datetime.now(timezone.utc)
+    service = AnalyticsService(db_session)
+    for metric_type, value in [
+        ("api_call", 1.0),
+        ("api_call", 1.0),
+        ("token_usage", 150.0),
+        ("token_usage", 50.0),
+        ("cost", 0.25),
+    ]:
+        service.create_metric_event(
+            MetricEventCreate(
+                user_id=user.id,
+                metric_type=metric_type,
+                metric_name=f"test.{metric_type}",
+                value=value,
+            )
+        )
+    for duration_ms, status in [(100.0, "success"), (300.0, "error")]:
+        service.create_performance_metric(
+            PerformanceMetricCreate(
+                operation="GET /api/test", duration_ms=duration_ms, status=status
+            )
+        )
+
+    stats = service.get_usage_statistics(
+        user.id,
+        now - timedelta(days=1),
+        now + timedelta(days=1),
+    )
+
+    assert stats.total_api_calls == 2
+    assert stats.total_tokens == 200
+    assert stats.total_cost == 0.25
+    assert stats.avg_response_time_ms == 200.0
+    assert stats.error_rate == 0.5
+
+
+def test_performance_statistics_percentiles(db_session: Session) -> None:
+    """Performance statistics report nearest-rank duration percentiles."""
+
+    now = datetime.now(timezone.utc)
+    service = AnalyticsService(db_session)
+    for duration_ms in range(1, 101):
+        service.create_performance_metric(
+            PerformanceMetricCreate(
+                operation="GET /api/test",
+                duration_ms=float(duration_ms),
+                status="success",
+            )
+        )
+
+    stats = service.get_performance_statistics(
+        "GET /api/test", now - timedelta(hours=1), now + timedelta(hours=1)
+    )
+
+    assert stats.total_calls == 100
+    assert (stats.p50_duration_ms, stats.p95_duration_ms) == (50.0, 95.0)
+    assert stats.p99_duration_ms == 99.0
+
+
+def test_cost_breakdown_totals_per_entity(db_session: Session) -> None:
+    """Cost breakdown sums cost, tokens and API calls for one agent."""
+
+    agent = Agent(name="Cost Agent", type="assistant")
+    other_agent = Agent(name="Other Agent", type="assistant")
+    db_session.add_all([agent, other_agent])
+    db_session.flush()
+    now = datetime.now(timezone.utc)
+    service = AnalyticsService(db_session)
+    for agent_id, metric_type, value in [
+        (agent.id, "cost", 0.5),
+        (agent.id, "cost", 0.25),
+        (agent.id, "token_usage", 300.0),
+        (agent.id, "api_call", 1.0),
+        (other_agent.id, "cost", 9.0),
+    ]:
+        service.create_metric_event(
+            MetricEventCreate(
+                agent_id=agent_id,
+                metric_type=metric_type,
+                metric_name=f"test.{metric_type}",
+                value=value,
+            )
+        )
+
+    window = (now - timedelta(hours=1), now + timedelta(hours=1))
+    breakdown = service.get_cost_breakdown("agent", agent.id, *window)
+    other = service.get_cost_breakdown("agent", other_agent.id, *window)
+
+    assert (breakdown.total_cost, breakdown.total_tokens) == (0.75, 300)
+    assert breakdown.api_calls == 1
+    assert (other.total_cost, other.api_calls) == (9.0, 0)
+
+
+def test_metrics_summary_coalesces_empty_window(db_session: Session) -> None:
+    """Summaries are zero-filled when no events match."""
+
+    user = create_user(db_session)
+    service = AnalyticsService(db_session)
+    empty = service.get_metrics_summary(MetricsQuery(user_id=user.id))
+    for value in (2.0, 4.0):
+        service.create_metric_event(
+            MetricEventCreate(
+                user_id=user.id,
+                metric_type="latency",
+                metric_name="test.latency",
+                value=value,
+                unit="ms",
+            )
+        )
+    summary = service.get_metrics_summary(MetricsQuery(user_id=user.id))
+
+    assert (empty.total_events, empty.total_value, empty.unit) == (0, 0.0, None)
+    assert (summary.total_events, summary.average_value) == (2, 3.0)
+    assert (summary.min_value, summary.max_value, summary.unit) == (2.0, 4.0, "ms")
+
+
+def test_aggregate_metrics_groups_events(db_session: Session) -> None:
+    """Aggregation stores one rollup row per metric group."""
+
+    user = create_user(db_session)
+    now = datetime.now(timezone.utc)
+    service = AnalyticsService(db_session)
+    for value in (1.0, 3.0):
+        service.create_metric_event(
+            MetricEventCreate(
+                user_id=user.id,
+                metric_type="token_usage",
+                metric_name="test.tokens",
+                value=value,
+                unit="tokens",
+            )
+        )
+
+    aggregated = service.aggregate_metrics(
+        "day", now - timedelta(days=1), now + timedelta(days=1)
+    )
+
+    assert len(aggregated) == 1
+    rollup = aggregated[0]
+    assert rollup.id is not None
+    assert rollup.aggregation_period == "day"
+    assert (rollup.count, rollup.sum, rollup.avg) == (2, 4.0, 2.0)
+    assert (rollup.min, rollup.max) == (1.0, 3.0)
+
+
+def test_usage_statistics_reads_hourly_rollups(db_session: Session) -> None:
+    """Rolled-up hours are read from the rollup and not double counted."""
+
+    user = create_user(db_session)
+    hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    previous_hour = hour - timedelta(hours=1)
+    for timestamp in (
+        previous_hour + timedelta(minutes=5),
+        hour + timedelta(minutes=5),
+    ):
+        db_session.add(
+            MetricEvent(
+                user_id=user.id,
+                metric_type="token_usage",
+                metric_name="test.tokens",
+                value=100.0,
+                timestamp=timestamp,
+            )
+        )
+    db_session.flush()
+
+    service = AnalyticsService(db_session)
+    service.aggregate_metrics(ROLLUP_PERIOD, previous_hour, hour)
+    stats = service.get_usage_statistics(
+        user.id, previous_hour - timedelta(hours=1), hour + timedelta(hours=1)
+    )
+
+    assert stats.total_tokens == 200
+
+
+def test_usage_statistics_falls_back_to_events_for_missing_rollups(
+    db_session: Session,
+) -> None:
+    """Hours missing from the rollup are read from raw events."""
+
+    user = create_user(db_session)
+    hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    for hours_ago in (5, 3, 1):
+        db_session.add(
+            MetricEvent(
+                user_id=user.id,
+                metric_type="token_usage",
+                metric_name="test.tokens",
+                value=100.0,
+                timestamp=hour - timedelta(hours=hours_ago, minutes=-5),
+            )
+        )
+    db_session.flush()
+
+    service = AnalyticsService(db_session)
+    # The rollup job ran for hours -5 and -1 but missed hour -3
+    for hours_ago in (5, 1):
+        period_start = hour - timedelta(hours=hours_ago)
+        service.aggregate_metrics(
+            ROLLUP_PERIOD, period_start, period_start + timedelta(hours=1)
+        )
+    stats = service.get_usage_statistics(user.id, hour - timedelta(hours=6), hour)
+
+    assert stats.total_tokens == 300
+
+
+def test_get_metric_events_keyset_pagination(db_session: Session) -> None:
+    """Metric events are paged newest first after a cursor."""
+
+    user = create_user(db_session)
+    now = datetime.now(timezone.utc)
+    for minutes in range(3):
+        db_session.add(
+            MetricEvent(
+                user_id=user.id,
+                metric_type="api_call",
+                metric_name=f"call.{minutes}",
+                value=1.0,
+                timestamp=now - timedelta(minutes=minutes),
+            )
+        )
+    db_session.flush()
+
+    service = AnalyticsService(db_session)
+    first_page = service.get_metric_events(MetricsQuery(user_id=user.id, limit=2))
+    next_page = service.get_metric_events(
+        MetricsQuery(user_id=user.id, limit=2, after_id=first_page[-1].id)
+    )
+
+    assert [m.metric_name for m in first_page] == ["call.0", "call.1"]
+    assert [m.metric_name for m in next_page] == ["call.2"]
+
+
+def test_get_metric_events_rejects_unknown_cursor(db_session: Session) -> None:
+    """Paging after an unknown metric event is an error."""
+
+    service = AnalyticsService(db_session)
+
+    with pytest.raises(InvalidCursorError):
+        service.get_metric_events(MetricsQuery(after_id=uuid4()))
+
+
+def test_get_metric_events_stream_ignores_pagination(db_session: Session) -> None:
+    """Streaming yields every matching event regardless of the page limit."""
+
+    user = create_user(db_session)
+    service = AnalyticsService(db_session)
+    service.create_metric_events_bulk(
+        [
+            MetricEventCreate(
+                user_id=user.id, metric_type="api_call", metric_name="s", value=1.0
+            )
+            for _ in range(5)
+        ]
+    )
+
+    streamed = list(
+        service.get_metric_events_stream(
+            MetricsQuery(user_id=user.id, limit=2), batch_size=2
+        )
+    )
+
+    assert len(streamed) == 5
+
+
 def test_usage_statistics_default_list_isolated() -> None:
     """Usage statistics should not share mutable defaults across instances."""
 
@@ -1,6 +1,14 @@
 """Tests for authentication service and API."""
 
-from backend.app import schemas
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from backend.app import models, schemas
+from backend.app.core.pagination import InvalidCursorError
 from backend.app.core.security import (
     create_user_token,
     decode_access_token,
@@ -10,6 +18,25 @@ from backend.app.core.security import (
 from backend.app.services import user_service
 
 
+@pytest.fixture(scope="module")
+def seed_user(module_session: Session) -> models.User:
+    """Create one user per module, so bcrypt runs once for the lookup tests.
+
+    Tests may still modify or delete it: their changes are rolled back with
+    the per-test SAVEPOINT, leaving the seeded row intact for the next test.
+    """
+    user = user_service.create_user(
+        module_session,
+        schemas.UserCreate(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+        ),
+    )
+    module_session.commit()
+    return user
+
+
 def test_password_hashing():
     """Test password hashing and verification."""
     password = "testpassword123"
@@ -23,61 +50,40 @@ def test_password_hashing():
 def test_create_user(db_session):
     """Test user creation."""
     user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
+        email="new@example.com",
+        username="newuser",
         password="password123",
         full_name="Test User",
     )
     user = user_service.create_user(db_session, user_data)
 
     assert user.id is not None
-    assert user.email == "test@example.com"
-    assert user.username == "testuser"
+    assert user.email == "new@example.com"
+    assert user.username == "newuser"
     assert user.full_name == "Test User"
     assert user.is_active is True
     assert user.is_superuser is False
     assert user.hashed_password != "password123"
 
 
-def test_get_user_by_email(db_session):
+def test_get_user_by_email(db_session, seed_user):
     """Test getting user by email."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    created_user = user_service.create_user(db_session, user_data)
-
     user = user_service.get_user_by_email(db_session, "test@example.com")
     assert user is not None
-    assert user.id == created_user.id
+    assert user.id == seed_user.id
     assert user.email == "test@example.com"
 
 
-def test_get_user_by_username(db_session):
+def test_get_user_by_username(db_session, seed_user):
     """Test getting user by username."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    created_user = user_service.create_user(db_session, user_data)
-
     user = user_service.get_user_by_username(db_session, "testuser")
     assert user is not None
-    assert user.id == created_user.id
+    assert user.id == seed_user.id
     assert user.username == "testuser"
 
 
-def test_authenticate_user_success(db_session):
+def test_authenticate_user_success(db_session, seed_user):
     """Test successful user authentication."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    user_service.create_user(db_session, user_data)
-
     # Test authentication with username
     user = user_service.authenticate_user(db_session, "testuser", "password123")
     assert user is not None
@@ -89,15 +95,8 @@ def test_authenticate_user_success(db_session):
     assert user.email == "test@example.com"
 
 
-def test_authenticate_user_failure(db_session):
+def test_authenticate_user_failure(db_session, seed_user):
     """Test failed user authentication."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    user_service.create_user(db_session, user_data)
-
     # Wrong password
     user = user_service.authenticate_user(db_session, "testuser", "wrongpassword")
     assert user is None
@@ -107,20 +106,13 @@ def test_authenticate_user_failure(db_session):
     assert user is None
 
 
-def test_update_user(db_session):
+def test_update_user(db_session, seed_user):
     """Test user update."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    created_user = user_service.create_user(db_session, user_data)
-
     update_data = schemas.UserUpdate(
         full_name="Updated Name",
         email="newemail@example.com",
     )
-    updated_user = user_service.update_user(db_session, created_user.id, update_data)
+    updated_user = user_service.update_user(db_session, seed_user.id, update_data)
 
     assert updated_user is not None
     assert updated_user.full_name == "Updated Name"
@@ -128,51 +120,49 @@ def test_update_user(db_session):
     assert updated_user.username == "testuser"  # Should not change
 
 
-def test_update_user_password(db_session):
+def test_update_user_password(db_session, seed_user):
     """Test password update."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="oldpassword",
-    )
-    created_user = user_service.create_user(db_session, user_data)
-    old_hash = created_user.hashed_password
+    old_hash = seed_user.hashed_password
 
     update_data = schemas.UserUpdate(password="newpassword")
-    updated_user = user_service.update_user(db_session, created_user.id, update_data)
+    updated_user = user_service.update_user(db_session, seed_user.id, update_data)
 
     assert updated_user is not None
     assert updated_user.hashed_password != old_hash
     assert verify_password("newpassword", updated_user.hashed_password)
 
 
-def test_list_users(db_session):
+def test_list_users(db_session, seed_user):
     """Test listing users."""
-    for i in range(3):
-        user_data = schemas.UserCreate(
-            email=f"user{i}@example.com",
-            username=f"user{i}",
-            password="password123",
-        )
-        user_service.create_user(db_session, user_data)
+    # Listing does not care about the hash, so reuse one instead of hashing
+    db_session.execute(
+        insert(models.User),
+        [
+            {
+                "email": f"user{i}@example.com",
+                "username": f"user{i}",
+                "hashed_password": seed_user.hashed_password,
+            }
+            for i in range(3)
+        ],
+    )
 
     users = user_service.list_users(db_session)
-    assert len(users) == 3
+    assert len(users) == 4  # three new users plus seed_user
 
 
-def test_delete_user(db_session):
-    """Test user deletion."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    created_user = user_service.create_user(db_session, user_data)
+def test_list_users_rejects_unknown_cursor(db_session):
+    """Test that an unknown keyset cursor is rejected."""
+    with pytest.raises(InvalidCursorError):
+        user_service.list_users(db_session, after_id=uuid.uuid4())
 
-    success = user_service.delete_user(db_session, created_user.id)
+
+def test_delete_user(db_session, seed_user):
+    """Test user deletion."""
+    success = user_service.delete_user(db_session, seed_user.id)
     assert success is True
 
-    user = user_service.get_user_by_id(db_session, created_user.id)
+    user = user_service.get_user_by_id(db_session, seed_user.id)
     assert user is None
 
 
@@ -200,19 +190,75 @@ def test_jwt_token_invalid():
     assert payload is None
 
 
-def test_update_last_login(db_session):
+def test_update_last_login(db_session, seed_user):
     """Test updating last login timestamp."""
-    user_data = schemas.UserCreate(
-        email="test@example.com",
-        username="testuser",
-        password="password123",
-    )
-    created_user = user_service.create_user(db_session, user_data)
-
-    assert created_user.last_login is None
+    assert seed_user.last_login is None
 
-    user_service.update_last_login(db_session, created_user.id)
+    user_service.update_last_login(db_session, seed_user.id)
 
-    updated_user = user_service.get_user_by_id(db_session, created_user.id)
+    updated_user = user_service.get_user_by_id(db_session, seed_user.id)
     assert updated_user is not None
     assert updated_user.last_login is not None
+
+
+def test_login_issues_one_select(db_session, seed_user):
+    """Test that authenticating and stamping last login reuse one user lookup."""
+    statements: list[str] = []
+    engine = db_session.get_bind().engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        verb = statement.split()[0].upper()
+        if verb not in ("SAVEPOINT", "RELEASE", "ROLLBACK"):
+            statements.append(verb)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        user = user_service.authenticate_user(
+            db_session, "test@example.com", "password123"
+        )
+        assert user is not None
+        user_service.update_last_login(db_session, user.id)
+        db_session.flush()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert statements == ["SELECT", "UPDATE"]
+
+
+def test_ensure_default_user(db_session):
+    """Test that the default guest user is created once and can log in."""
+    guest = user_service.ensure_default_user(db_session)
+
+    assert guest.username == user_service.DEFAULT_GUEST_USERNAME
+    assert guest.is_superuser is True
+    assert user_service.ensure_default_user(db_session).id == guest.id
+    assert verify_password(user_service.DEFAULT_GUEST_PASSWORD, guest.hashed_password)
+
+
+def test_ensure_default_user_ignores_stale_cached_id(db_session, monkeypatch):
+    """Test that a cached guest ID from another database is not trusted."""
+    monkeypatch.setattr(user_service, "_guest_user_id", uuid.uuid4())
+
+    guest = user_service.ensure_default_user(db_session)
+
+    assert guest.username == user_service.DEFAULT_GUEST_USERNAME
+    assert user_service._guest_user_id == guest.id
+
+
+def test_get_first_user_survives_deleted_cached_user(db_session, seed_user):
+    """Test that the cached first user is dropped once that user is deleted."""
+    first = seed_user
+    second = user_service.create_user(
+        db_session,
+        schemas.UserCreate(
+            email="second@example.com", username="second", password="password123"
+        ),
+    )
+    second.created_at = first.created_at + timedelta(seconds=1)
+    db_session.flush()
+
+    assert user_service.get_first_user(db_session).id == first.id
+
+    user_service.delete_user(db_session, first.id)
+
+    assert user_service.get_first_user(db_session).id == second.id
@@ -0,0 +1,82 @@
+"""Tests for process-local read caches."""
+
+from backend.app import schemas
+from backend.app.core.cache import TTLCache, template_cache
+from backend.app.services import agent_template_service
+
+
+def test_ttl_cache_reuses_value_until_expired() -> None:
+    """Loader runs once per key while the entry is fresh."""
+    cache: TTLCache[int] = TTLCache(ttl_seconds=60)
+    calls = []
+
+    def loader() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_set("key", loader) == 1
+    assert cache.get_or_set("key", loader) == 1
+
+    cache.ttl_seconds = 0
+    assert cache.get_or_set("other", loader) == 2
+    assert cache.get_or_set("other", loader) == 3
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    """Entries beyond max_entries are evicted oldest first."""
+    cache: TTLCache[str] = TTLCache(ttl_seconds=60, max_entries=2)
+    cache.get_or_set("a", lambda: "a")
+    cache.get_or_set("b", lambda: "b")
+    cache.get_or_set("c", lambda: "c")
+
+    assert cache.get_or_set("a", lambda: "reloaded") == "reloaded"
+
+
+def test_ttl_cache_does_not_store_misses() -> None:
+    """A None result is reloaded on the next lookup."""
+    cache: TTLCache[int | None] = TTLCache(ttl_seconds=60)
+
+    assert cache.get_or_set("key", lambda: None) is None
+    assert cache.get_or_set("key", lambda: 1) == 1
+
+
+def test_template_writes_invalidate_cache_on_commit(db_session) -> None:
+    """Creating a template drops cached template lists once it commits."""
+    key = ("list", 0, 100, None)
+    template_cache.get_or_set(key, list)
+
+    agent_template_service.create_template(
+        db_session,
+        schemas.AgentTemplateCreate(name="Cached", category="support", config={}),
+    )
+    assert template_cache.get_or_set(key, lambda: None) == []
+
+    db_session.commit()
+
+    assert template_cache.get_or_set(key, lambda: None) is None
+
+
+def test_reads_racing_a_write_are_not_cached(db_session) -> None:
+    """Reads issued between a write and its commit leave no stale entry."""
+    key = ("list", 0, 100, None)
+
+    def create(name: str) -> None:
+        agent_template_service.create_template(
+            db_session,
+            schemas.AgentTemplateCreate(name=name, category="support", config={}),
+        )
+
+    # A read that finishes before the commit is dropped by the commit
+    create("Read before commit")
+    template_cache.get_or_set(key, lambda: ["stale"])
+    db_session.commit()
+    assert template_cache.get_or_set(key, lambda: None) is None
+
+    # A read that is still loading when the commit lands is never stored
+    def load_during_commit() -> list[str]:
+        db_session.commit()
+        return ["stale"]
+
+    create("Read during commit")
+    assert template_cache.get_or_set(key, load_during_commit) == ["stale"]
+    assert template_cache.get_or_set(key, lambda: None) is None
@@ -0,0 +1,96 @@
+"""Tests for chat service."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from backend.app import models, schemas
+from backend.app.core.pagination import InvalidCursorError
+from backend.app.services import agent_service, chat_service
+
+
+def test_list_messages_keyset_pagination(db_session):
+    """Messages are paged after a cursor in creation order."""
+    agent = agent_service.create_agent(
+        db_session, schemas.AgentCreate(name="Chat Agent", type="assistant")
+    )
+    conversation = chat_service.create_conversation(
+        db_session, schemas.ConversationCreate(agent_id=agent.id)
+    )
+    created_at = datetime.now(timezone.utc)
+    for i in range(5):
+        db_session.add(
+            models.Message(
+                conversation_id=conversation.id,
+                role="user",
+                content=f"message {i}",
+                created_at=created_at + timedelta(seconds=i),
+            )
+        )
+    db_session.flush()
+
+    first_page = chat_service.list_messages(db_session, conversation.id, limit=2)
+    second_page = chat_service.list_messages(
+        db_session, conversation.id, after_id=first_page[-1].id, limit=2
+    )
+    last_page = chat_service.list_messages(
+        db_session, conversation.id, after_id=second_page[-1].id
+    )
+
+    assert [m.content for m in first_page] == ["message 0", "message 1"]
+    assert [m.content for m in second_page] == ["message 2", "message 3"]
+    assert [m.content for m in last_page] == ["message 4"]
+
+
+def test_list_messages_rejects_unknown_cursor(db_session):
+    """An unknown cursor is an error instead of a restart at the first page."""
+    with pytest.raises(InvalidCursorError):
+        chat_service.list_messages(db_session, uuid4(), after_id=uuid4())
+
+
+def test_list_messages_api_limits(client, db):
+    """The messages endpoint enforces the page cap and rejects bad cursors."""
+    url = f"/api/chat/sessions/{uuid4()}/messages"
+
+    over_cap = client.get(url, params={"limit": chat_service.MESSAGE_PAGE_LIMIT + 1})
+    unknown_cursor = client.get(url, params={"after_id": str(uuid4())})
+
+    assert over_cap.status_code == 422
+    assert unknown_cursor.status_code == 400
+
+
+def test_message_pages_reach_the_newest_message(client, db, make_agent):
+    """Following after_id page by page, as the chat UI does, reaches the end."""
+    conversation = chat_service.create_conversation(
+        db, schemas.ConversationCreate(agent_id=make_agent().id)
+    )
+    created_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    db.execute(
+        insert(models.Message),
+        [
+            {
+                "conversation_id": conversation.id,
+                "role": "user",
+                "content": f"message {i}",
+                "created_at": created_at + timedelta(seconds=i),
+            }
+            for i in range(chat_service.MESSAGE_PAGE_LIMIT)
+        ],
+    )
+    url = f"/api/chat/sessions/{conversation.id}/messages"
+    sent = client.post(url, json={"role": "user", "content": "newest"})
+    assert sent.status_code == 201
+
+    messages: list[dict] = []
+    params = {"limit": chat_service.MESSAGE_PAGE_LIMIT}
+    while True:
+        page = client.get(url, params=params).json()
+        messages.extend(page)
+        if len(page) < chat_service.MESSAGE_PAGE_LIMIT:
+            break
+        params["after_id"] = page[-1]["id"]
+
+    assert len(messages) == chat_service.MESSAGE_PAGE_LIMIT + 1
+    assert messages[-1]["content"] == "newest"
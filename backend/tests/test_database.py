@@ -0,0 +1,76 @@
+"""Tests for request-scoped database sessions."""
+
+import pytest
+from fastapi import Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import database, models, schemas
+from backend.app.main import app
+from backend.app.services import agent_service
+
+
+@pytest.fixture
+def session_factory(db_connection, monkeypatch):
+    """Bind get_db to the test connection, whose commits become SAVEPOINTs."""
+    factory = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    return factory
+
+
+def test_get_db_commits_on_success(session_factory):
+    """Changes flushed by services are committed when the request ends."""
+    dependency = database.get_db(Request({"type": "http"}))
+    db = next(dependency)
+    agent_service.create_agent(db, schemas.AgentCreate(name="Kept", type="assistant"))
+
+    with pytest.raises(StopIteration):
+        next(dependency)
+
+    with session_factory() as check:
+        assert check.query(models.Agent).filter_by(name="Kept").count() == 1
+
+
+def test_get_db_rolls_back_on_error(session_factory):
+    """Changes are discarded when the request handler raises."""
+    dependency = database.get_db(Request({"type": "http"}))
+    db = next(dependency)
+    agent_service.create_agent(
+        db, schemas.AgentCreate(name="Discarded", type="assistant")
+    )
+
+    with pytest.raises(RuntimeError):
+        dependency.throw(RuntimeError("handler failed"))
+
+    with session_factory() as check:
+        assert check.query(models.Agent).filter_by(name="Discarded").count() == 0
+
+
+async def test_write_request_commits_before_response(db):
+    """The session is committed before the response status is sent."""
+    events = []
+    event.listen(db, "after_commit", lambda session: events.append("commit"))
+
+    async def recording_app(scope, receive, send):
+        async def record(message):
+            if message["type"] == "http.response.start":
+                events.append(f"response {message['status']}")
+            await send(message)
+
+        await app(scope, receive, record)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=recording_app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/agents/", json={"name": "Committed", "type": "assistant"}
+        )
+
+    assert response.status_code == 201
+    assert events == ["commit", "response 201"]
@@ -3,61 +3,57 @@
 import uuid
 
 import pytest
-from collections.abc import Iterator
-
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
-from backend.app.main import app
 from backend.app.services import group_chat_service
-from backend.app.database import get_db
 
 
 @pytest.fixture
-def api_client(db_session: Session) -> Iterator[TestClient]:
-    """Provide TestClient with database dependency override."""
-
-    def _override_get_db() -> Iterator[Session]:
-        try:
-            yield db_session
-        finally:
-            pass
+def api_client(db: Session, async_client: AsyncClient) -> AsyncClient:
+    """Provide the shared async client, serving requests from db_session."""
+    return async_client
 
-    app.dependency_overrides[get_db] = _override_get_db
-    with TestClient(app) as client:
-        yield client
-    app.dependency_overrides.pop(get_db, None)
 
+@pytest.fixture(scope="module")
+def sample_agents(module_session: Session) -> list[models.Agent]:
+    """Create sample agents once per module.
 
-@pytest.fixture
-def sample_agents(db_session: Session) -> list[models.Agent]:
-    """Create sample agents for testing."""
+    No test modifies the agents themselves, only group chats referencing them,
+    so every test can share one set rolled back when the module finishes.
+    """
     agents = []
+    versions = []
     for i in range(3):
-        agent = models.Agent(
-            name=f"Test Agent {i + 1}",
-            description=f"Test agent {i + 1} description",
-            type="assistant",
-            status="active",
+        # Client-side IDs link both rows up front, so each table is written
+        # with one multi-row INSERT instead of a flush per object
+        agent_id, version_id = uuid.uuid4(), uuid.uuid4()
+        agents.append(
+            models.Agent(
+                id=agent_id,
+                name=f"Test Agent {i + 1}",
+                description=f"Test agent {i + 1} description",
+                type="assistant",
+                status="active",
+                current_version_id=version_id,
+            )
         )
-        db_session.add(agent)
-        db_session.flush()
-
-        version = models.AgentVersion(
-            agent_id=agent.id,
-            version="1.0.0",
-            config={
-                "system_message": f"You are test agent {i + 1}",
-                "model": "gpt-4",
-            },
-            is_current=True,
+        versions.append(
+            models.AgentVersion(
+                id=version_id,
+                agent_id=agent_id,
+                version="1.0.0",
+                config={
+                    "system_message": f"You are test agent {i + 1}",
+                    "model": "gpt-4",
+                },
+                is_current=True,
+            )
         )
-        db_session.add(version)
-        agent.current_version_id = version.id
-        agents.append(agent)
 
-    db_session.commit()
+    module_session.add_all([*agents, *versions])
+    module_session.commit()
     return agents
 
 
@@ -115,7 +111,7 @@ def group_chat_conversation(
         extra_data={"agent_name": sample_agents[0].name},
     )
     db_session.add_all([initial_message, reply_message])
-    db_session.commit()
+    db_session.flush()
 
     return conversation
 
@@ -151,6 +147,36 @@ def test_list_group_chats(
     assert any(gc.id == sample_group_chat.id for gc in group_chats)
 
 
+def test_list_group_chats_keyset_pagination(
+    db_session: Session, sample_agents: list[models.Agent]
+) -> None:
+    """Test paging through group chats with an after_id cursor."""
+    for i in range(3):
+        group_chat_service.create_group_chat(
+            db_session,
+            schemas.GroupChatCreate(
+                title=f"Chat {i}",
+                participant_agent_ids=[agent.id for agent in sample_agents[:2]],
+            ),
+        )
+
+    first_page = group_chat_service.list_group_chats(db_session, limit=2)
+    second_page = group_chat_service.list_group_chats(
+        db_session, limit=2, after_id=first_page[-1].id
+    )
+
+    titles = [gc.title for gc in first_page + second_page]
+    assert sorted(titles) == ["Chat 0", "Chat 1", "Chat 2"]
+
+
+def test_list_group_chats_eager_loads_participants(
+    sample_group_chat: models.GroupChat, no_lazy_loads: Session
+) -> None:
+    """Test that listing group chats does not lazy load participants per chat."""
+    group_chats = group_chat_service.list_group_chats(no_lazy_loads)
+    assert [len(gc.participants) for gc in group_chats] == [2]
+
+
 def test_get_group_chat(
     db_session: Session, sample_group_chat: models.GroupChat
 ) -> None:
@@ -188,6 +214,16 @@ def test_update_group_chat(
     assert updated.selection_strategy == "selector"
 
 
+def test_update_nonexistent_group_chat(db_session: Session) -> None:
+    """Test updating a group chat that does not exist."""
+    update_data = schemas.GroupChatUpdate(title="Updated Title")
+
+    assert (
+        group_chat_service.update_group_chat(db_session, uuid.uuid4(), update_data)
+        is None
+    )
+
+
 def test_delete_group_chat(
     db_session: Session, sample_group_chat: models.GroupChat
 ) -> None:
@@ -197,6 +233,12 @@ def test_delete_group_chat(
 
     group_chat = group_chat_service.get_group_chat(db_session, sample_group_chat.id)
     assert group_chat is None
+    assert group_chat_service.list_participants(db_session, sample_group_chat.id) == []
+
+
+def test_delete_nonexistent_group_chat(db_session: Session) -> None:
+    """Test deleting a group chat that does not exist."""
+    assert group_chat_service.delete_group_chat(db_session, uuid.uuid4()) is False
 
 
 def test_add_participant(
@@ -239,6 +281,13 @@ def test_remove_participant(
     )
     assert not any(p.agent_id == agent_to_remove.id for p in participants)
 
+    assert (
+        group_chat_service.remove_participant(
+            db_session, sample_group_chat.id, agent_to_remove.id
+        )
+        is False
+    )
+
 
 def test_list_participants(
     db_session: Session, sample_group_chat: models.GroupChat
@@ -266,11 +315,11 @@ def test_list_group_chat_messages(
     assert [message.role for message in messages] == ["user", "assistant"]
 
 
-def test_api_create_group_chat(
-    api_client: TestClient, sample_agents: list[models.Agent]
+async def test_api_create_group_chat(
+    api_client: AsyncClient, sample_agents: list[models.Agent]
 ) -> None:
     """Test creating group chat via API."""
-    response = api_client.post(
+    response = await api_client.post(
         "/api/group-chats",
         json={
             "title": "API Test Group",
@@ -288,30 +337,40 @@ def test_api_create_group_chat(
     assert data["selection_strategy"] == "round_robin"
 
 
-def test_api_list_group_chats(api_client: TestClient) -> None:
+async def test_api_list_group_chats(api_client: AsyncClient) -> None:
     """Test listing group chats via API."""
-    response = api_client.get("/api/group-chats")
+    response = await api_client.get("/api/group-chats")
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
 
 
-def test_api_get_group_chat(
-    api_client: TestClient, sample_group_chat: models.GroupChat
+async def test_api_list_group_chats_rejects_unknown_cursor(
+    api_client: AsyncClient,
+) -> None:
+    """Test that paging after an unknown group chat returns 400."""
+    response = await api_client.get(
+        "/api/group-chats", params={"after_id": str(uuid.uuid4())}
+    )
+    assert response.status_code == 400
+
+
+async def test_api_get_group_chat(
+    api_client: AsyncClient, sample_group_chat: models.GroupChat
 ) -> None:
     """Test getting group chat via API."""
-    response = api_client.get(f"/api/group-chats/{sample_group_chat.id}")
+    response = await api_client.get(f"/api/group-chats/{sample_group_chat.id}")
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == str(sample_group_chat.id)
     assert data["title"] == sample_group_chat.title
 
 
-def test_api_update_group_chat(
-    api_client: TestClient, sample_group_chat: models.GroupChat
+async def test_api_update_group_chat(
+    api_client: AsyncClient, sample_group_chat: models.GroupChat
 ) -> None:
     """Test updating group chat via API."""
-    response = api_client.put(
+    response = await api_client.put(
         f"/api/group-chats/{sample_group_chat.id}",
         json={"title": "Updated via API", "max_rounds": 20},
     )
@@ -322,21 +381,21 @@ def test_api_update_group_chat(
     assert data["max_rounds"] == 20
 
 
-def test_api_delete_group_chat(
-    api_client: TestClient, sample_group_chat: models.GroupChat
+async def test_api_delete_group_chat(
+    api_client: AsyncClient, sample_group_chat: models.GroupChat
 ) -> None:
     """Test deleting group chat via API."""
-    response = api_client.delete(f"/api/group-chats/{sample_group_chat.id}")
+    response = await api_client.delete(f"/api/group-chats/{sample_group_chat.id}")
     assert response.status_code == 204
 
 
-def test_api_add_participant(
-    api_client: TestClient,
+async def test_api_add_participant(
+    api_client: AsyncClient,
     sample_group_chat: models.GroupChat,
     sample_agents: list[models.Agent],
 ) -> None:
     """Test adding participant via API."""
-    response = api_client.post(
+    response = await api_client.post(
         f"/api/group-chats/{sample_group_chat.id}/participants",
         json={
             "agent_id": str(sample_agents[2].id),
@@ -349,36 +408,38 @@ def test_api_add_participant(
     assert data["agent_id"] == str(sample_agents[2].id)
 
 
-def test_api_remove_participant(
-    api_client: TestClient,
+async def test_api_remove_participant(
+    api_client: AsyncClient,
     sample_group_chat: models.GroupChat,
     sample_agents: list[models.Agent],
 ) -> None:
     """Test removing participant via API."""
-    response = api_client.delete(
+    response = await api_client.delete(
         f"/api/group-chats/{sample_group_chat.id}/participants/{sample_agents[0].id}"
     )
     assert response.status_code == 204
 
 
-def test_api_list_participants(
-    api_client: TestClient, sample_group_chat: models.GroupChat
+async def test_api_list_participants(
+    api_client: AsyncClient, sample_group_chat: models.GroupChat
 ) -> None:
     """Test listing participants via API."""
-    response = api_client.get(f"/api/group-chats/{sample_group_chat.id}/participants")
+    response = await api_client.get(
+        f"/api/group-chats/{sample_group_chat.id}/participants"
+    )
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
     assert len(data) >= 1
 
 
-def test_api_list_group_chat_messages(
-    api_client: TestClient,
+async def test_api_list_group_chat_messages(
+    api_client: AsyncClient,
     sample_group_chat: models.GroupChat,
     group_chat_conversation: models.Conversation,
 ) -> None:
     """Test listing group chat messages via API."""
-    response = api_client.get(f"/api/group-chats/{sample_group_chat.id}/messages")
+    response = await api_client.get(f"/api/group-chats/{sample_group_chat.id}/messages")
 
     assert response.status_code == 200
     data = response.json()
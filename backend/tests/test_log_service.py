@@ -1,27 +1,48 @@
 """Tests for log service."""
 
 import json
+import uuid
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
+from backend.app.core.pagination import InvalidCursorError
 from backend.app.services import log_service
 
 
-def test_create_log(db_session):
-    """Test creating a log entry."""
-    # Create conversation first
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
-
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
+@pytest.fixture(scope="module")
+def seeded_conversation(module_session: Session) -> uuid.UUID:
+    """Create the conversation every log test writes to, once per module.
+
+    Tests only add and remove logs, which roll back with their own savepoint,
+    so the agent and conversation rows can be shared.
+    """
+    agent_id = uuid.uuid4()
+    conversation_id = uuid.uuid4()
+    module_session.add_all(
+        [
+            models.Agent(
+                id=agent_id, name="Test Agent", type="assistant", status="active"
+            ),
+            models.Conversation(
+                id=conversation_id,
+                agent_id=agent_id,
+                title="Test Conversation",
+                status="active",
+            ),
+        ]
     )
-    db_session.add(conversation)
-    db_session.commit()
+    module_session.commit()
+    return conversation_id
+
 
+def test_create_log(db_session, seeded_conversation):
+    """Test creating a log entry."""
     # Create log
     log_data = schemas.ExecutionLogCreate(
-        conversation_id=conversation.id,
+        conversation_id=seeded_conversation,
         event_type=schemas.EventType.MESSAGE,
         level=schemas.LogLevel.INFO,
         agent_name="Test Agent",
@@ -32,7 +53,7 @@ def test_create_log(db_session):
     result = log_service.create_log(db_session, log_data)
 
     assert result.id is not None
-    assert result.conversation_id == conversation.id
+    assert result.conversation_id == seeded_conversation
     assert result.event_type == "message"
     assert result.level == "info"
     assert result.agent_name == "Test Agent"
@@ -41,59 +62,84 @@ def test_create_log(db_session):
     assert result.timestamp is not None
 
 
-def test_get_logs(db_session):
+def test_get_logs(db_session, seeded_conversation):
     """Test retrieving logs for a conversation."""
-    # Setup
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
-
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
-    )
-    db_session.add(conversation)
-    db_session.commit()
-
     # Create multiple logs
-    for i in range(5):
-        log_data = schemas.ExecutionLogCreate(
-            conversation_id=conversation.id,
-            event_type=schemas.EventType.MESSAGE,
-            level=schemas.LogLevel.INFO if i < 3 else schemas.LogLevel.ERROR,
-            agent_name="Test Agent",
-            content=f"Log message {i}",
-        )
-        log_service.create_log(db_session, log_data)
+    created = log_service.create_logs_bulk(
+        db_session,
+        [
+            schemas.ExecutionLogCreate(
+                conversation_id=seeded_conversation,
+                event_type=schemas.EventType.MESSAGE,
+                level=schemas.LogLevel.INFO if i < 3 else schemas.LogLevel.ERROR,
+                agent_name="Test Agent",
+                content=f"Log message {i}",
+            )
+            for i in range(5)
+        ],
+    )
+    assert created == 5
 
     # Test without filter
-    logs = log_service.get_logs(db_session, conversation.id)
+    logs = log_service.get_logs(db_session, seeded_conversation)
     assert len(logs) == 5
 
     # Test with level filter
     filter_params = schemas.LogFilter(level=schemas.LogLevel.ERROR)
-    logs = log_service.get_logs(db_session, conversation.id, filter_params)
+    logs = log_service.get_logs(db_session, seeded_conversation, filter_params)
     assert len(logs) == 2
-    assert all(log.level == "error" for log in logs)
+    assert {log.level for log in logs} == {"error"}
 
     # Test with limit
     filter_params = schemas.LogFilter(limit=2)
-    logs = log_service.get_logs(db_session, conversation.id, filter_params)
+    logs = log_service.get_logs(db_session, seeded_conversation, filter_params)
     assert len(logs) == 2
 
+    # Test keyset pagination continues after the last log of the first page
+    next_page = log_service.get_logs(
+        db_session,
+        seeded_conversation,
+        schemas.LogFilter(limit=10, after_id=logs[-1].id),
+    )
+    assert len(next_page) == 3
+    assert not {log.id for log in logs} & {log.id for log in next_page}
+
+
+def test_get_logs_rejects_unknown_cursor(db_session, seeded_conversation):
+    """Test that paging after an unknown log is rejected."""
+    with pytest.raises(InvalidCursorError):
+        log_service.get_logs(
+            db_session, seeded_conversation, schemas.LogFilter(after_id=uuid.uuid4())
+        )
 
-def test_get_log_stats(db_session):
-    """Test getting log statistics."""
-    # Setup
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
 
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
+def _query_plan(db_session, stmt):
+    """Return SQLite's EXPLAIN QUERY PLAN steps for a statement."""
+    sql = stmt.compile(
+        dialect=db_session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True},
     )
-    db_session.add(conversation)
-    db_session.commit()
+    plan = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+    return [row.detail for row in plan]
 
+
+@pytest.mark.parametrize(
+    "filter_params",
+    [
+        pytest.param(schemas.LogFilter(), id="unfiltered"),
+        pytest.param(schemas.LogFilter(level=schemas.LogLevel.ERROR), id="level"),
+    ],
+)
+def test_get_logs_pages_in_index_order(db_session, filter_params):
+    """Test that newest-first log pages are read without a sort step."""
+    stmt = log_service._logs_stmt(db_session, uuid.uuid4(), filter_params)
+    plan = _query_plan(db_session, stmt)
+
+    assert not any("TEMP B-TREE" in step for step in plan)
+
+
+def test_get_log_stats(db_session, seeded_conversation):
+    """Test getting log statistics."""
     # Create logs with different levels and event types
     log_data = [
         (schemas.EventType.MESSAGE, schemas.LogLevel.INFO),
@@ -102,18 +148,22 @@ def test_get_log_stats(db_session):
         (schemas.EventType.FUNCTION_CALL, schemas.LogLevel.DEBUG),
     ]
 
-    for event_type, level in log_data:
-        log = schemas.ExecutionLogCreate(
-            conversation_id=conversation.id,
-            event_type=event_type,
-            level=level,
-            agent_name="Test Agent",
-            content=f"{event_type.value} - {level.value}",
-        )
-        log_service.create_log(db_session, log)
+    log_service.create_logs_bulk(
+        db_session,
+        [
+            schemas.ExecutionLogCreate(
+                conversation_id=seeded_conversation,
+                event_type=event_type,
+                level=level,
+                agent_name="Test Agent",
+                content=f"{event_type.value} - {level.value}",
+            )
+            for event_type, level in log_data
+        ],
+    )
 
     # Get stats
-    stats = log_service.get_log_stats(db_session, conversation.id)
+    stats = log_service.get_log_stats(db_session, seeded_conversation)
 
     assert stats.total_logs == 4
     assert stats.by_level["info"] == 2
@@ -126,55 +176,48 @@ def test_get_log_stats(db_session):
     assert stats.time_range["end"] is not None
 
 
-def test_delete_logs(db_session):
+def test_delete_logs(db_session, seeded_conversation):
     """Test deleting logs."""
-    # Setup
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
-
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
-    )
-    db_session.add(conversation)
-    db_session.commit()
-
     # Create logs
-    for i in range(3):
-        log_data = schemas.ExecutionLogCreate(
-            conversation_id=conversation.id,
-            event_type=schemas.EventType.MESSAGE,
-            level=schemas.LogLevel.INFO,
-            agent_name="Test Agent",
-            content=f"Log message {i}",
-        )
-        log_service.create_log(db_session, log_data)
+    log_service.create_logs_bulk(
+        db_session,
+        [
+            schemas.ExecutionLogCreate(
+                conversation_id=seeded_conversation,
+                event_type=schemas.EventType.MESSAGE,
+                level=schemas.LogLevel.INFO,
+                agent_name="Test Agent",
+                content=f"Log message {i}",
+            )
+            for i in range(3)
+        ],
+    )
 
     # Delete logs
-    count = log_service.delete_logs(db_session, conversation.id)
+    count = log_service.delete_logs(db_session, seeded_conversation)
     assert count == 3
 
     # Verify deletion
-    logs = log_service.get_logs(db_session, conversation.id)
+    logs = log_service.get_logs(db_session, seeded_conversation)
     assert len(logs) == 0
 
 
-def test_export_logs_json(db_session):
-    """Test exporting logs to JSON."""
-    # Setup
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
-
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
+def test_delete_logs_searches_conversation_index(db_session):
+    """Test that deleting a conversation's logs does not scan the table."""
+    stmt = delete(models.ExecutionLog).where(
+        models.ExecutionLog.conversation_id == uuid.uuid4()
     )
-    db_session.add(conversation)
-    db_session.commit()
+    plan = _query_plan(db_session, stmt)
 
+    assert plan
+    assert all(step.startswith("SEARCH") for step in plan)
+
+
+def test_export_logs_json(db_session, seeded_conversation):
+    """Test exporting logs to JSON."""
     # Create logs
     log_data = schemas.ExecutionLogCreate(
-        conversation_id=conversation.id,
+        conversation_id=seeded_conversation,
         event_type=schemas.EventType.MESSAGE,
         level=schemas.LogLevel.INFO,
         agent_name="Test Agent",
@@ -184,8 +227,10 @@ def test_export_logs_json(db_session):
     log_service.create_log(db_session, log_data)
 
     # Export to JSON
-    export_data = log_service.export_logs(
-        db_session, conversation.id, schemas.LogExportFormat.JSON
+    export_data = "".join(
+        log_service.export_logs(
+            db_session, seeded_conversation, schemas.LogExportFormat.JSON
+        )
     )
 
     # Verify JSON format
@@ -196,22 +241,11 @@ def test_export_logs_json(db_session):
     assert logs_list[0]["data"]["tokens"] == 100
 
 
-def test_export_logs_txt(db_session):
+def test_export_logs_txt(db_session, seeded_conversation):
     """Test exporting logs to plain text."""
-    # Setup
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
-
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
-    )
-    db_session.add(conversation)
-    db_session.commit()
-
     # Create log
     log_data = schemas.ExecutionLogCreate(
-        conversation_id=conversation.id,
+        conversation_id=seeded_conversation,
         event_type=schemas.EventType.MESSAGE,
         level=schemas.LogLevel.INFO,
         agent_name="Test Agent",
@@ -220,8 +254,10 @@ def test_export_logs_txt(db_session):
     log_service.create_log(db_session, log_data)
 
     # Export to TXT
-    export_data = log_service.export_logs(
-        db_session, conversation.id, schemas.LogExportFormat.TXT
+    export_data = "".join(
+        log_service.export_logs(
+            db_session, seeded_conversation, schemas.LogExportFormat.TXT
+        )
     )
 
     # Verify text format
@@ -231,22 +267,11 @@ def test_export_logs_txt(db_session):
     assert "[Test Agent]" in export_data
 
 
-def test_export_logs_csv(db_session):
+def test_export_logs_csv(db_session, seeded_conversation):
     """Test exporting logs to CSV."""
-    # Setup
-    agent = models.Agent(name="Test Agent", type="assistant", status="active")
-    db_session.add(agent)
-    db_session.flush()
-
-    conversation = models.Conversation(
-        agent_id=agent.id, title="Test Conversation", status="active"
-    )
-    db_session.add(conversation)
-    db_session.commit()
-
     # Create log
     log_data = schemas.ExecutionLogCreate(
-        conversation_id=conversation.id,
+        conversation_id=seeded_conversation,
         event_type=schemas.EventType.MESSAGE,
         level=schemas.LogLevel.INFO,
         agent_name="Test Agent",
@@ -255,8 +280,10 @@ def test_export_logs_csv(db_session):
     log_service.create_log(db_session, log_data)
 
     # Export to CSV
-    export_data = log_service.export_logs(
-        db_session, conversation.id, schemas.LogExportFormat.CSV
+    export_data = "".join(
+        log_service.export_logs(
+            db_session, seeded_conversation, schemas.LogExportFormat.CSV
+        )
     )
 
     # Verify CSV format
@@ -267,3 +294,123 @@ def test_export_logs_csv(db_session):
     assert "message" in lines[1]
     assert "Test Agent" in lines[1]
     assert "Test log message" in lines[1]
+
+
+def test_log_buffer_flushes_batched_logs(db_engine):
+    """Test that buffered logs are written in a batch on flush."""
+    # The buffer commits through its own connection, so use a fresh database
+    # instead of the rolled-back db_session
+    with Session(db_engine) as session:
+        agent = models.Agent(name="Test Agent", type="assistant", status="active")
+        session.add(agent)
+        session.flush()
+
+        conversation = models.Conversation(
+            agent_id=agent.id, title="Test Conversation", status="active"
+        )
+        session.add(conversation)
+        session.commit()
+
+        buffer = log_service.LogBuffer(db_engine, interval=60)
+        queued = [
+            buffer.add(
+                schemas.ExecutionLogCreate(
+                    conversation_id=conversation.id,
+                    event_type=schemas.EventType.MESSAGE,
+                    level=schemas.LogLevel.INFO,
+                    content=f"Buffered {i}",
+                )
+            )
+            for i in range(3)
+        ]
+        assert all(log.id is not None for log in queued)
+
+        assert buffer.flush(timeout=5)
+
+        filter_params = schemas.LogFilter(limit=10, offset=0)
+        logs = log_service.get_logs(session, conversation.id, filter_params)
+        assert {log.id for log in logs} == {log.id for log in queued}
+
+
+def test_log_buffer_drops_only_failing_rows(db_engine):
+    """Test that one unwritable row does not discard the rest of its batch."""
+    with db_engine.connect() as connection:
+        # StaticPool keeps this one connection, so the pragma sticks
+        connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    with Session(db_engine) as session:
+        agent = models.Agent(name="Test Agent", type="assistant", status="active")
+        session.add(agent)
+        session.flush()
+
+        conversation = models.Conversation(
+            agent_id=agent.id, title="Test Conversation", status="active"
+        )
+        session.add(conversation)
+        session.commit()
+
+        buffer = log_service.LogBuffer(db_engine, interval=60)
+        queued = [
+            buffer.add(
+                schemas.ExecutionLogCreate(
+                    conversation_id=conversation_id,
+                    event_type=schemas.EventType.MESSAGE,
+                    content="Buffered",
+                )
+            )
+            for conversation_id in (conversation.id, uuid.uuid4(), conversation.id)
+        ]
+
+        assert buffer.flush(timeout=5)
+
+        logs = log_service.get_logs(session, conversation.id)
+        assert {log.id for log in logs} == {queued[0].id, queued[2].id}
+
+
+def test_create_log_endpoint_rejects_unknown_conversation(client, db):
+    """Test that POST /logs/ still returns 404 before queueing the log."""
+    response = client.post(
+        "/api/logs/",
+        json={
+            "conversation_id": str(uuid.uuid4()),
+            "event_type": "message",
+            "content": "Orphan",
+        },
+    )
+
+    assert response.status_code == 404
+
+
+def test_export_logs_streams_in_batches(db_session, seeded_conversation, monkeypatch):
+    """Test that exports spanning several batches stay well-formed."""
+    monkeypatch.setattr(log_service, "EXPORT_BATCH_SIZE", 2)
+
+    log_service.create_logs_bulk(
+        db_session,
+        [
+            schemas.ExecutionLogCreate(
+                conversation_id=seeded_conversation,
+                event_type=schemas.EventType.MESSAGE,
+                level=schemas.LogLevel.INFO,
+                content=f"Message {i}",
+            )
+            for i in range(5)
+        ],
+    )
+
+    json_chunks = list(
+        log_service.export_logs(
+            db_session, seeded_conversation, schemas.LogExportFormat.JSON
+        )
+    )
+    assert len(json_chunks) == 4  # Three batches plus the closing bracket
+    assert len(json.loads("".join(json_chunks))) == 5
+
+    csv_export = "".join(
+        log_service.export_logs(
+            db_session, seeded_conversation, schemas.LogExportFormat.CSV
+        )
+    )
+    lines = csv_export.strip().split("\n")
+    assert len(lines) == 6
+    assert lines[0].startswith("Timestamp,")
@@ -26,10 +26,32 @@ export const createConversation = (
     body: payload,
   });
 
-export const fetchConversationMessages = (
+// Largest page the messages endpoint serves (backend MESSAGE_PAGE_LIMIT)
+export const MESSAGE_PAGE_LIMIT = 200;
+
+export const fetchConversationMessages = async (
   conversationId: string,
-): Promise<Message[]> =>
-  apiFetch<Message[]>(`/chat/sessions/${conversationId}/messages`);
+): Promise<Message[]> => {
+  const messages: Message[] = [];
+  let page: Message[];
+
+  // Pages run oldest first; keep following the last ID until a short page
+  do {
+    const search = new URLSearchParams({
+      limit: MESSAGE_PAGE_LIMIT.toString(),
+    });
+    if (messages.length > 0) {
+      search.set("after_id", messages[messages.length - 1].id);
+    }
+
+    page = await apiFetch<Message[]>(
+      `/chat/sessions/${conversationId}/messages?${search.toString()}`,
+    );
+    messages.push(...page);
+  } while (page.length === MESSAGE_PAGE_LIMIT);
+
+  return messages;
+};
 
 export const sendConversationMessage = (
   conversationId: string,